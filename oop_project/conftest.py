@@ -2,7 +2,37 @@
 import os
 import sys
 
+import pytest
+
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Live-Tests gegen echte Hardware (PV, Wallbox, Grid-Meter) ausführen",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "live: Test braucht erreichbare Hardware, läuft nur mit --live",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Ohne --live werden Hardware-Tests übersprungen statt minutenlang
+    # in Modbus-/HTTP-Timeouts gegen unerreichbare IPs zu laufen.
+    if config.getoption("--live"):
+        return
+
+    skip_live = pytest.mark.skip(reason="Hardware-Test: nur mit --live ausführen")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
@@ -46,14 +46,12 @@ async def main():
             print("\n=== battery.raw ===")
             print(raw)
 
-        # Zusätzlich alle Attribute schön ausgeben
+        # Zusätzlich alle Datenattribute schön ausgeben.
+        # vars() statt dir(): dir() würde auch Methoden und Properties
+        # anfassen und könnte dabei weitere API-Requests auslösen.
         print("\n=== All attributes of battery ===")
-        for attr in dir(battery):
+        for attr, value in (vars(battery) or {}).items():
             if not attr.startswith("_"):
-                try:
-                    value = getattr(battery, attr)
-                except Exception:
-                    value = "<error>"
                 print(f"{attr}: {value}")
 
 
@@ -1,14 +1,24 @@
 # main_oop.py
 
-import time
+import asyncio
+import contextlib
+import signal
+import sys
 from typing import Optional
 
+import aiohttp
 from goecharger_api_lite import GoeCharger
 
-from grid_meter import GridMeter, GridMeterError
-from pv_inverter import PVInverter, PVInverterError
-from wallbox import Wallbox, WallboxError
-from surplus_controller import SurplusController, ControllerParams
+from smart_home.grid_meter import GridMeter, GridMeterError
+from smart_home.pv_inverter import PVInverter, PVInverterError
+from smart_home.wallbox import Wallbox, WallboxError
+from smart_home.surplus_controller import SurplusController, ControllerParams
+from smart_home.sample_window import SampleWindow
+
+
+# go-e setter enum wrapper: constant, so build it once at import time
+# instead of re-constructing it on every control decision.
+_SET_VALUES = GoeCharger.SettableValueEnum()
 
 
 # ---------------------------------------------------------------------------
@@ -33,12 +43,18 @@ GRID_SAMPLE_EVERY   = 10      # grid samples every 10 s
 CONTROL_PERIOD_SEC  = 300     # 5 min control interval
 MAX_GRID_SAMPLES    = CONTROL_PERIOD_SEC // GRID_SAMPLE_EVERY  # ~30
 
+# Adaptive grid sampling: after an excursion (large jump or sign flip)
+# sample faster for a short window, then fall back to the slow cadence
+GRID_SAMPLE_FAST_SEC    = 2     # s, sampling interval while "fast"
+GRID_FAST_WINDOW_SEC    = 60    # s, how long fast sampling stays active
+GRID_EXCURSION_DELTA_KW = 1.0   # kW, jump between samples that triggers it
+
 
 # ---------------------------------------------------------------------------
 # Helper: read snapshot for debug output
 # ---------------------------------------------------------------------------
 
-def read_snapshot_for_debug(
+async def read_snapshot_for_debug(
     grid_meter: GridMeter,
     pv_inv: PVInverter,
     wb: Wallbox
@@ -46,31 +62,43 @@ def read_snapshot_for_debug(
     """
     Read instantaneous values for debugging and print them.
     Does not affect controller state.
+
+    The three device reads are independent network round-trips, so they
+    run concurrently via asyncio.gather: one loop iteration costs the
+    slowest read instead of the sum of all three.
     """
-    try:
-        pv_kw = pv_inv.read_total_power_kw()
-    except PVInverterError as e:
+    pv_kw, grid_kw, wb_kw = await asyncio.gather(
+        pv_inv.read_total_power_kw_async(),
+        grid_meter.read_power_kw_async(),
+        wb.read_power_kw_async(),
+        return_exceptions=True,
+    )
+
+    # Collect all lines and emit them with a single write: up to four
+    # separate print() calls per second each cost their own syscall on a
+    # line-buffered TTY.
+    lines: list[str] = []
+
+    if isinstance(pv_kw, BaseException):
+        lines.append(f"[Debug] PV read error: {pv_kw}")
         pv_kw = float("nan")
-        print(f"[Debug] PV read error: {e}")
 
-    try:
-        grid_kw = grid_meter.read_power_kw()
-    except GridMeterError as e:
+    if isinstance(grid_kw, BaseException):
+        lines.append(f"[Debug] Grid read error: {grid_kw}")
         grid_kw = float("nan")
-        print(f"[Debug] Grid read error: {e}")
 
-    try:
-        wb_kw = wb.read_power_kw()
-    except WallboxError as e:
+    if isinstance(wb_kw, BaseException):
+        lines.append(f"[Debug] WB read error: {wb_kw}")
         wb_kw = float("nan")
-        print(f"[Debug] WB read error: {e}")
 
-    print(
+    lines.append(
         f"[Now] PV: {pv_kw:6.2f} kW | "
         f"Grid: {grid_kw:6.2f} kW | "
         f"WB: {wb_kw:6.2f} kW"
     )
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 # ---------------------------------------------------------------------------
 # Helper: apply controller decision to go-e charger
@@ -79,23 +107,26 @@ def read_snapshot_for_debug(
 def apply_charger_decision(
     charger: GoeCharger,
     phase_new: int,
-    current_new: int
+    current_new: int,
+    status: Optional[dict] = None
 ) -> None:
     """
     Apply the controller's decision (phase + current) to the go-e charger
     using the HTTP API (goecharger_api_lite).
-    """
-    setValues = charger.SettableValueEnum()
 
-    # Read current charger state
-    status_min = charger.get_status(status_type=charger.STATUS_MINIMUM)
-    car_state = status_min["car_state"]   # e.g. "Idle", "Charging", ...
+    ``status`` may be a full charger status the caller already fetched
+    this control tick; it is then reused instead of re-requested.
+    """
+    setValues = _SET_VALUES
 
-    phase_status = charger.get_phase_mode()
-    phase_current = 1 if phase_status["phase_mode"] == "one" else 3
+    # Read current charger state with one combined status request instead
+    # of three separate HTTP GETs (car state, phase mode, ampere).
+    if status is None:
+        status = charger.get_status(status_type=charger.STATUS_FULL)
 
-    amp_status = charger.get_ampere()
-    current_current = amp_status["ampere_allowed"]
+    car_state = status["car_state"]   # e.g. "Idle", "Charging", ...
+    phase_current = 1 if status["phase_mode"] == "one" else 3
+    current_current = status["ampere_allowed"]
 
     # Debug info
     print(
@@ -114,28 +145,27 @@ def apply_charger_decision(
         charger.set_charging_mode(setValues.ChargingMode.off)
         return
 
-    # Case 3: start charging
+    # Case 3: start charging (skip writes that match the current state)
     if car_state not in ("Idle", "Charging") and current_new > 0:
-        if phase_new == 1:
-            charger.set_phase_mode(setValues.PhaseMode.one)
-        else:
-            charger.set_phase_mode(setValues.PhaseMode.three)
-        charger.set_ampere(current_new)
+        if phase_new != phase_current:
+            if phase_new == 1:
+                charger.set_phase_mode(setValues.PhaseMode.one)
+            else:
+                charger.set_phase_mode(setValues.PhaseMode.three)
+        if current_new != current_current:
+            charger.set_ampere(current_new)
         charger.set_charging_mode(setValues.ChargingMode.on)
         return
 
-    # Case 4: adjust ongoing charging
+    # Case 4: adjust ongoing charging (only write what actually changed)
     if car_state == "Charging" and current_new > 0:
-        # phase change 1 -> 3
-        if phase_current == 1 and phase_new == 3:
-            charger.set_phase_mode(setValues.PhaseMode.three)
-            charger.set_ampere(current_new)
-        # phase change 3 -> 1
-        elif phase_current == 3 and phase_new == 1:
-            charger.set_phase_mode(setValues.PhaseMode.one)
+        if phase_new != phase_current:
+            if phase_new == 1:
+                charger.set_phase_mode(setValues.PhaseMode.one)
+            else:
+                charger.set_phase_mode(setValues.PhaseMode.three)
             charger.set_ampere(current_new)
-        # same phase, adjust current only
-        else:
+        elif current_new != current_current:
             charger.set_ampere(current_new)
 
 
@@ -143,82 +173,201 @@ def apply_charger_decision(
 # Main loop (OOP orchestration)
 # ---------------------------------------------------------------------------
 
-def main():
-    # Instantiate hardware objects
-    grid_meter = GridMeter(GRID_IP)
-    pv_inv     = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT)
-    wb         = Wallbox(WB_IP)
-
-    # Instantiate controller with default parameters
-    params = ControllerParams()
-    controller = SurplusController(params)
-
-    # Instantiate go-e HTTP API client
-    charger = GoeCharger(WB_IP)
-
-    # State for averaging
-    grid_samples: list[float] = []
-    counter = 0  # 0..CONTROL_PERIOD_SEC-1
-
-    while True:
-        try:
-            # --- periodic grid sampling for averaging ---
-            if counter % GRID_SAMPLE_EVERY == 0:
+async def main():
+    # All sessions/sockets are registered on one AsyncExitStack, so a
+    # Ctrl-C, SIGTERM or crash unwinds them cleanly instead of leaving
+    # FDs and half-open TCP connections behind.
+    async with contextlib.AsyncExitStack() as stack:
+        # One process-wide HTTP session, shared by every async HTTP device
+        # read: pooled connections, cached DNS and file descriptors are
+        # amortized across hosts. Long keep-alive avoids a fresh TCP
+        # handshake on every poll of the Tasmota reader (~150 ms first call
+        # vs ~2 ms on a reused connection).
+        session = await stack.enter_async_context(aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=16,
+                keepalive_timeout=600,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=3.0),
+        ))
+
+        # Instantiate hardware objects
+        grid_meter = GridMeter(GRID_IP, session=session)
+        pv_inv     = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT)
+        wb         = Wallbox(WB_IP)
+
+        stack.callback(pv_inv.close)
+        stack.callback(grid_meter.session.close)
+
+        # Instantiate controller with default parameters
+        params = ControllerParams()
+        controller = SurplusController(params)
+
+        # Instantiate go-e HTTP API client
+        charger = GoeCharger(WB_IP)
+
+        # State for averaging: ring buffer with O(1) eviction and running sum
+        grid_samples = SampleWindow(maxlen=MAX_GRID_SAMPLES)
+
+        # Warm up all device connections before the loops start: the first
+        # request pays the TCP handshake / session setup, so fault the paths
+        # in now and surface connectivity problems immediately. Failures are
+        # only reported — the periodic loops retry on their own.
+        warmup_results = await asyncio.gather(
+            grid_meter.read_power_kw_async(),
+            pv_inv.read_total_power_kw_async(),
+            wb.read_power_kw_async(),
+            asyncio.to_thread(charger.get_status, status_type=charger.STATUS_MINIMUM),
+            return_exceptions=True,
+        )
+        for name, res in zip(("Grid", "PV", "WB", "Charger"), warmup_results):
+            if isinstance(res, BaseException):
+                print(f"[Warn] {name} warm-up read failed: {res}")
+
+        loop = asyncio.get_running_loop()
+
+        async def sleep_until(deadline: float) -> None:
+            """Sleep until the given loop.time() deadline (no-op if passed)."""
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+        # Each periodic task advances its deadline by `next += interval`
+        # (not `now + interval`), so a slow device read delays a single tick
+        # instead of shifting the whole cadence.
+
+        async def grid_loop() -> None:
+            """
+            Sample grid power every GRID_SAMPLE_EVERY seconds.
+
+            Adaptive duty cycling: after a grid excursion (jump larger than
+            GRID_EXCURSION_DELTA_KW or an import/export sign flip) the loop
+            samples every GRID_SAMPLE_FAST_SEC for GRID_FAST_WINDOW_SEC so
+            transients are captured sooner, then falls back to the slow
+            steady-state cadence.
+            """
+            # Bind hot lookups to locals (LOAD_FAST instead of repeated
+            # LOAD_GLOBAL/LOAD_ATTR in a loop that runs for days).
+            read_grid = grid_meter.read_power_kw_async
+            append_sample = grid_samples.append
+
+            last_grid_kw: Optional[float] = None
+            fast_until = 0.0
+
+            next_deadline = loop.time()
+            while True:
                 try:
-                    grid_kw = grid_meter.read_power_kw()
-                    grid_samples.append(grid_kw)
+                    grid_kw = await read_grid()
+                    append_sample(grid_kw)
+
+                    if last_grid_kw is not None and (
+                        abs(grid_kw - last_grid_kw) > GRID_EXCURSION_DELTA_KW
+                        or (grid_kw < 0.0) != (last_grid_kw < 0.0)
+                    ):
+                        fast_until = loop.time() + GRID_FAST_WINDOW_SEC
+                    last_grid_kw = grid_kw
                 except GridMeterError as e:
                     print(f"[Warn] GridMeter error (avg): {e}")
 
-                # keep only the last MAX_GRID_SAMPLES entries
-                if len(grid_samples) > MAX_GRID_SAMPLES:
-                    grid_samples = grid_samples[-MAX_GRID_SAMPLES:]
-
-            # --- periodic control step (every CONTROL_PERIOD_SEC) ---
-            if PV_SURPLUS_MODE and grid_samples and (counter == CONTROL_PERIOD_SEC - 1):
-                # average grid power over last period
-                grid_avg_kw = sum(grid_samples) / len(grid_samples)
-
-                # read wallbox average power (instant value as approximation)
-                try:
-                    wb_kw = wb.read_power_kw()
-                except WallboxError as e:
-                    wb_kw = 0.0
-                    print(f"[Warn] Wallbox power read error (avg): {e}")
+                if loop.time() < fast_until:
+                    next_deadline += GRID_SAMPLE_FAST_SEC
+                else:
+                    next_deadline += GRID_SAMPLE_EVERY
+                await sleep_until(next_deadline)
 
-                # controller step: compute phase, current, p_available
-                result = controller.step(grid_kw=grid_avg_kw, wb_kw=wb_kw)
+        async def control_loop() -> None:
+            """Run one control step every CONTROL_PERIOD_SEC seconds."""
+            next_deadline = loop.time() + CONTROL_PERIOD_SEC
+            while True:
+                await sleep_until(next_deadline)
+                next_deadline += CONTROL_PERIOD_SEC
 
-                print(
-                    f"[5min] Grid_avg: {grid_avg_kw:6.2f} kW | "
-                    f"WB_avg: {wb_kw:6.2f} kW | "
-                    f"P_avail: {result['p_available_kw']:6.2f} kW | "
-                    f"phase={result['phase']} | current={result['current']} A"
-                )
+                if not (PV_SURPLUS_MODE and grid_samples):
+                    continue
 
-                # apply controller decision to charger
-                apply_charger_decision(
-                    charger=charger,
-                    phase_new=result["phase"],
-                    current_new=result["current"]
-                )
-
-                # reset averaging window
-                grid_samples = []
+                try:
+                    # average grid power over last period (O(1) running sum)
+                    grid_avg_kw = grid_samples.mean()
+
+                    # read wallbox average power (instant value as approximation)
+                    try:
+                        wb_kw = await wb.read_power_kw_async()
+                    except WallboxError as e:
+                        wb_kw = 0.0
+                        print(f"[Warn] Wallbox power read error (avg): {e}")
+
+                    # controller step: compute phase, current, p_available
+                    result = controller.step(grid_kw=grid_avg_kw, wb_kw=wb_kw)
+
+                    print(
+                        f"[5min] Grid_avg: {grid_avg_kw:6.2f} kW | "
+                        f"WB_avg: {wb_kw:6.2f} kW | "
+                        f"P_avail: {result['p_available_kw']:6.2f} kW | "
+                        f"phase={result['phase']} | current={result['current']} A"
+                    )
+
+                    # apply controller decision to charger; goecharger_api_lite
+                    # is synchronous, so run it in a worker thread to keep the
+                    # grid/debug tasks responsive during the HTTP round-trips.
+                    # Fetch the full status once and hand it in, so the
+                    # decision reuses it instead of re-requesting.
+                    status = await asyncio.to_thread(
+                        charger.get_status, status_type=charger.STATUS_FULL
+                    )
+                    await asyncio.to_thread(
+                        apply_charger_decision,
+                        charger=charger,
+                        phase_new=result["phase"],
+                        current_new=result["current"],
+                        status=status,
+                    )
+
+                    # reset averaging window
+                    grid_samples.clear()
+
+                except Exception as e:
+                    print(f"[Error] control step: {e}")
+
+        async def debug_loop() -> None:
+            """Print an instant snapshot every SAMPLE_INTERVAL_SEC seconds."""
+            # Same local-binding trick as in grid_loop: this runs once per
+            # second for the lifetime of the process.
+            snapshot = read_snapshot_for_debug
+            interval = SAMPLE_INTERVAL_SEC
+
+            next_deadline = loop.time()
+            while True:
+                try:
+                    await snapshot(grid_meter, pv_inv, wb)
+                except Exception as e:
+                    print(f"[Debug] snapshot error: {e}")
 
-            # --- debug output each loop (instant snapshot) ---
-            try:
-                read_snapshot_for_debug(grid_meter, pv_inv, wb)
-            except Exception as e:
-                print(f"[Debug] snapshot error: {e}")
+                next_deadline += interval
+                await sleep_until(next_deadline)
 
-        except Exception as e:
-            print(f"[Error] main loop: {e}")
+        # Run the three periodic tasks as one aggregate future, and cancel
+        # it on SIGTERM so the AsyncExitStack above can unwind the
+        # sessions and Modbus sockets cleanly on `systemctl stop` & co.
+        tasks = asyncio.gather(grid_loop(), control_loop(), debug_loop())
+        try:
+            loop.add_signal_handler(signal.SIGTERM, tasks.cancel)
+        except NotImplementedError:
+            # e.g. Windows event loop — Ctrl-C/KeyboardInterrupt still works
+            pass
 
-        # update counter and sleep
-        counter = (counter + 1) % CONTROL_PERIOD_SEC
-        time.sleep(SAMPLE_INTERVAL_SEC)
+        try:
+            await tasks
+        except asyncio.CancelledError:
+            pass
 
 
 if __name__ == "__main__":
-    main()
+    # uvloop (Linux only) speeds up socket-heavy asyncio workloads like
+    # this one considerably; purely optional drop-in.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main())
@@ -1,18 +1,50 @@
+import gzip
+import hashlib
+import io
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime
-import asyncio
-import traceback
+import logging
 
-from flask import Flask, jsonify, Response, request
+from flask import Flask, Response, request, send_file
+
+log = logging.getLogger(__name__)
+
+# orjson serialisiert den Status-Dict 2-5x schneller als die stdlib und
+# liefert direkt Bytes; Fallback auf json, falls nicht installiert.
+# Sämtliche Routen kodieren über _json/_json_dumps — flask.jsonify (und
+# damit Flasks Encoder-Pfad) wird nirgends mehr benutzt.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        # Kompakte Separatoren wie bei orjson: spart ~10% Payload-Bytes
+        # gegenüber dem Default mit Leerzeichen
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json(obj, status: int = 200) -> Response:
+    """
+    Ersatz für flask.jsonify: kodiert direkt mit _json_dumps zu Bytes,
+    ohne Flasks Encoder-/Default-Handler-Pfad — spürbar auf den häufig
+    gepollten kleinen Antworten.
+    """
+    return Response(_json_dumps(obj), status=status, mimetype="application/json")
 
 #from goecharger_api_lite import GoeCharger
-from .simple_goe_client import SimpleGoEClient, SimpleGoEClientError
+from .simple_goe_client import GoEStatus, SimpleGoEClient, SimpleGoEClientError
 
 from .grid_meter import GridMeter, GridMeterError
 from .pv_inverter import PVInverter, PVInverterError
 from .wallbox import Wallbox, WallboxError
 from .surplus_controller import SurplusController, ControllerParams
+from .sample_window import SampleWindow
 from .car_client import CarClient, CarClientError
 
 
@@ -33,7 +65,37 @@ SAMPLE_INTERVAL_SEC = 2
 GRID_SAMPLE_EVERY   = 1
 CONTROL_PERIOD      = 90
 MAX_GRID_SAMPLES    = CONTROL_PERIOD // GRID_SAMPLE_EVERY 
-CAR_STATUS_PERIOD   = 90  
+CAR_STATUS_PERIOD   = 90
+# Abgestecktes Auto: SoC ändert sich nicht → Fahrzeugstatus-Polling um
+# diesen Faktor strecken (Cloud-API und Fahrzeug-Akku schonen)
+CAR_STATUS_UNPLUGGED_FACTOR = 5
+
+# Live-Snapshot nur, solange ein Client kürzlich /api/status geholt hat
+IDLE_POLL_TIMEOUT_SEC = 10   # [s]
+
+# Tief-Idle: niemand schaut zu UND kein Auto angesteckt — dann wird der
+# komplette Haupt-Loop-Takt um diesen Faktor gestreckt (2 s -> 30 s).
+# Regelung und SoC-Check laufen weiter auf ihren monotonen Deadlines;
+# beim nächsten Client-Poll bzw. Anstecken greift wieder der volle Takt.
+IDLE_TICK_STRETCH = 15
+
+# Obergrenze pro Geräte-Read im Snapshot: Geräte-Timeout (3 s) plus
+# Marge. Ein hängendes Gerät verzögert so höchstens einen Tick statt
+# den Loop unbegrenzt festzuhalten.
+DEVICE_READ_TIMEOUT_SEC = 3.5   # [s]
+
+# Exponentielles Backoff pro Gerät: nach einem Fehler wird das Gerät
+# erst wieder nach der Backoff-Zeit abgefragt (Verdopplung bis zum Cap,
+# Reset beim ersten Erfolg). Ein totes Gerät frisst so nicht bei jedem
+# Tick sein volles Timeout-Budget.
+DEVICE_BACKOFF_MIN_SEC = 2      # [s] erstes Backoff nach einem Fehler
+DEVICE_BACKOFF_MAX_SEC = 60     # [s] Obergrenze
+
+# Stale-while-revalidate für den Fahrzeugstatus: ist er älter als der
+# weiche TTL, stößt der Regelpfad einen Hintergrund-Refresh an und rechnet
+# solange mit dem alten Wert weiter. Der harte TTL ist die Altersprüfung
+# in check_battery_saving_stop (BATTERY_SAVING_MAX_AGE_SEC).
+CAR_STATUS_SOFT_TTL_SEC = 300   # [s]
 
 # Battery saving: stop charging when SoC is high and data is fresh
 BATTERY_SAVING_SOC_LIMIT    = 85.0      # [%] threshold for battery-saving stop
@@ -55,27 +117,29 @@ class AppState:
     - Controller
     - Live-Daten und Mittelwerte
     - aktiven Modus (pv_surplus / monitor_only)
+
+    Nebenläufigkeitsmodell: ``status`` ist ein unveränderliches Snapshot-
+    Dict, das Schreiber per Copy-on-Write komplett ersetzen (atomarer
+    Referenz-Swap unter dem GIL). ``self.lock`` serialisiert nur die
+    Schreiber untereinander; Leser (HTTP-Routen, SSE, Loop-Lesepfade)
+    ziehen lockfrei eine Referenz und arbeiten auf dem Snapshot.
     """
 
     def __init__(self):
 
-        # ensure asyncio event loop for aiohttp / GoeCharger (Python 3.11+)
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
         # Geräte
         self.grid_meter = GridMeter(GRID_IP)
         self.pv_inv     = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT)
         self.wb         = Wallbox(WB_IP)
         self.controller = SurplusController(ControllerParams())
+        # deltaP ändert sich zur Laufzeit nicht: einmal cachen statt die
+        # Attributkette controller.params.deltaP jeden Tick aufzulösen
+        self._deltaP = self.controller.params.deltaP
         # self.charger    = GoeCharger(WB_IP)
         try:
             self.charger = SimpleGoEClient(WB_IP)
         except SimpleGoEClientError as e:
-            print(f"[Warn] Could not initialize SimpleGoEClient: {e}")
+            log.warning(f"Could not initialize SimpleGoEClient: {e}")
             self.charger = None
 
         # CarClient (Renault)
@@ -83,16 +147,69 @@ class AppState:
         try:
             self.car_client = CarClient()
         except CarClientError as e:
-            print(f"[Warn] CarClient not initialized: {e}")
-
-        # Zustand für Mittelung 
-        self.grid_samples: list[float] = []
-
-        # Loop counters (loop ticks)
-        self.grid_counter: int       = 0      # for grid sampling
-        self.control_counter: int    = 0      # for PV-surplus control period
-        self.soc_counter: int        = 0      # for SoC protection checks
-        self.car_status_counter: int = 0      # for Renault car status polling
+            log.warning(f"CarClient not initialized: {e}")
+
+        # Kleiner Thread-Pool für die Geräte-Reads im Snapshot: die vier
+        # Abfragen (PV, Grid, WB, Charger) sind unabhängige Netzwerk-
+        # Roundtrips; parallel ausgeführt kostet ein Snapshot-Tick nur
+        # noch die langsamste Antwort statt der Summe aller Latenzen.
+        # Der Renault-Call gehört bewusst NICHT in diesen Fan-out: er
+        # dauert Sekunden und läuft deshalb in einem eigenen Thread
+        # (run_car_status_loop) bzw. als Soft-TTL-Refresh auf dem Pool.
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dev-io")
+
+        # Serialisiert Snapshot-Durchläufe (Loop-Thread vs. On-Demand-
+        # Refresh nach einer Idle-Phase): die Geräte-Clients teilen sich
+        # persistente Sockets und vertragen keine parallelen Reads.
+        self._snapshot_lock = threading.Lock()
+
+        # Zeitpunkt des letzten /api/status-Abrufs: ohne zuschauende
+        # Clients werden die Live-Geräte-Polls übersprungen.
+        self._last_client_poll_ts: float = 0.0
+
+        # Fehler-Backoff pro Gerät: aktuelles Backoff [s] und monotoner
+        # Zeitpunkt, ab dem das Gerät wieder abgefragt werden darf.
+        self._backoff = {"pv": 0, "grid": 0, "wb": 0, "charger": 0}
+        self._next_ok = {"pv": 0.0, "grid": 0.0, "wb": 0.0, "charger": 0.0}
+
+        # SSE-Infrastruktur: /api/stream-Generatoren warten auf dieser
+        # Condition; _publish_status weckt sie bei jeder Statusänderung.
+        # _sse_clients zählt offene Streams für die Idle-Erkennung.
+        self._status_cond = threading.Condition()
+        self._sse_clients: int = 0
+
+        # Zustand für Mittelung: Ringpuffer mit O(1)-Eviction und
+        # inkrementeller Summe (Mittelwert ohne Neu-Aufsummieren)
+        self.grid_samples = SampleWindow(maxlen=MAX_GRID_SAMPLES)
+
+        # Letzter Grid-Messwert aus dem Snapshot (Wert + monotonic-
+        # Zeitstempel): run_loop verwendet ihn für die Mittelung wieder,
+        # statt den Zähler ein zweites Mal pro Tick abzufragen.
+        self._last_grid_kw: float | None = None
+        self._last_grid_kw_ts: float = 0.0
+
+        # Letzter Charger-Status aus dem Snapshot: apply_charger_decision
+        # verwendet ihn wieder, solange er frisch ist, statt die Box im
+        # selben Tick ein zweites Mal abzufragen. Nach jedem Schreibzugriff
+        # wird der Cache invalidiert.
+        self._last_charger_status: GoEStatus | None = None
+        self._last_charger_status_ts: float = 0.0
+
+        # Unabhängige monotone Scheduler (Deadlines in time.monotonic()-
+        # Sekunden) statt gekoppelter Modulo-Zähler: ein Fehlerpfad oder
+        # übersprungener Tick verschiebt so keine der anderen Perioden.
+        # Die Regelung läuft erstmals nach einer vollen Periode, Grid-
+        # Sampling und SoC-Check sofort.
+        now = time.monotonic()
+        self._next_grid_sample_t = now
+        self._next_control_t = now + CONTROL_PERIOD * SAMPLE_INTERVAL_SEC
+        self._next_soc_check_t = now
+
+        # Stale-while-revalidate-Zustand für den Fahrzeugstatus:
+        # monotoner Zeitstempel des letzten erfolgreichen Updates plus
+        # das Future eines ggf. laufenden Hintergrund-Refreshs.
+        self._car_status_mono_ts: float = 0.0
+        self._car_refresh_future = None
 
         # Flag: gerade von monitor_only → pv_surplus gewechselt
         self.just_switched_to_pv = False
@@ -130,20 +247,87 @@ class AppState:
             "car_plug_status": None,
             "car_charging_status": None,
             "car_status_timestamp": None,
+            "car_status_ts_epoch": None,   # float-Epoch parallel zum ISO-String
             "car_status_valid": False,
             "car_status_last_attempt": None,
         }
 
+        # Reines Writer-Lock: es koordiniert nur die Schreiber (Loop-
+        # Thread, Control-Step, Car-Status), deren Copy-on-Write-Swap ein
+        # Read-Modify-Write über Threads ist, und das just_switched_to_pv-
+        # Flag.
+        # Leser nehmen kein Lock: der Status wird per Copy-on-Write
+        # ersetzt (self.status = {**old, **patch}), und das Lesen einer
+        # Attributreferenz ist in CPython atomar.
         self.lock = threading.Lock()
 
-        print("[Debug] AppState.__init__ completed")
+        # Vorserialisierter /api/status-Payload: wird bei jeder
+        # Statusänderung einmal erzeugt, damit der GET-Handler nur noch
+        # fertige Bytes ausliefert (kein Dict-Copy und kein JSON-Encode
+        # pro Poll und Browser-Tab).
+        self._status_bytes: bytes = b"{}"
+        self._status_etag: str = ""
+        self._publish_status()
+
+        log.debug("AppState.__init__ completed")
+
+    def close(self) -> None:
+        """
+        Pool und persistente Geräte-Verbindungen schließen (für Tests und
+        einen sauberen Shutdown; im Dauerbetrieb lebt der Singleton bis
+        zum Prozessende).
+        """
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.pv_inv.close()
+        self.wb.close()
+
+    # ------------------------------------------------------------------
+    # Status-Publikation für /api/status
+    # ------------------------------------------------------------------
+    def _publish_status(self) -> None:
+        """
+        Serialisiert self.status einmalig zu Bytes und berechnet den ETag.
+
+        Muss nach jeder Statusänderung aufgerufen werden. /api/status
+        liest die beiden Attribute anschließend ohne Lock — eine
+        Attribut-Zuweisung ist in CPython atomar. Der HTTP-Pfad ist damit
+        vollständig vom Geräte-Polling entkoppelt: egal wie viele Clients
+        anfragen, kein Request löst einen Geräte-Read oder ein erneutes
+        Serialisieren aus.
+        """
+        payload = _json_dumps(self.status)
+        # ETag korrekt als quoted-string (RFC 9110); Browser schicken den
+        # Wert in If-None-Match unverändert zurück
+        digest = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        self._status_etag = f'"{digest}"'
+        self._status_bytes = payload
+
+        # Wartende SSE-Streams über den neuen Stand benachrichtigen
+        with self._status_cond:
+            self._status_cond.notify_all()
+
+    def _patch_status(self, **fields) -> None:
+        """
+        Aktualisiert eine Gruppe von Status-Feldern per Copy-on-Write.
+
+        Jeder Schreiberpfad (1-Hz-Snapshot, Control-Step, Fahrzeugstatus,
+        SoC-Schätzung) fasst damit nur noch seine eigenen Felder an —
+        dieselbe Schreib-Lokalität wie getrennte Teil-Dicts pro Pfad,
+        ohne den öffentlichen ``status``-Vertrag für Routen und Tests
+        aufzugeben. Pro Aufruf gibt es genau einen Swap und genau ein
+        Publish (Serialisierung + SSE-Wakeup), egal wie viele Felder
+        der Pfad schreibt.
+        """
+        with self.lock:
+            self.status = {**self.status, **fields}
+        self._publish_status()
 
     # ------------------------------------------------------------------
     # Mode-Handling
     # ------------------------------------------------------------------
     def get_mode(self) -> str:
-        with self.lock:
-            return self.status.get("mode", "pv_surplus")
+        # Lockfrei: liest nur die aktuelle Status-Referenz
+        return self.status.get("mode", "pv_surplus")
 
     def set_mode(self, mode: str) -> None:
         if mode not in ("pv_surplus", "monitor_only"):
@@ -151,20 +335,64 @@ class AppState:
 
         with self.lock:
             old_mode = self.status.get("mode", "pv_surplus")
-            self.status["mode"] = mode
+            self.status = {**self.status, "mode": mode}
 
             # Wenn von monitor_only → pv_surplus gewechselt wird:
             if old_mode == "monitor_only" and mode == "pv_surplus":
                 # Flag setzen: beim nächsten Loop-Durchlauf sofort regeln
                 self.just_switched_to_pv = True
 
+        self._publish_status()
+
     # ------------------------------------------------------------------
     # Live-Snapshot (wird jede Sekunde aufgerufen)
     # ------------------------------------------------------------------
+    def _read_pv(self) -> tuple[float, dict]:
+        """
+        Gesamtleistung und String-Leistungen des Wechselrichters lesen.
+
+        Ein einziger Modbus-Span-Read (Register 172..281) liefert beides
+        in einem Roundtrip statt zwei.
+        """
+        snap = self.pv_inv.read_power_snapshot()
+        return snap["total_kw"], snap
+
     def update_instant_snapshot(self) -> None:
         """
         Lies PV, Grid, WB sowie Phase/Strom der Wallbox und aktualisiere status.
         """
+        with self._snapshot_lock:
+            self._update_instant_snapshot_locked()
+
+    def _refresh_snapshot_nowait(self) -> None:
+        """
+        On-Demand-Snapshot nach einer Idle-Phase (läuft im _io_pool).
+
+        Überspringt sich selbst, wenn gerade ein Snapshot läuft — sonst
+        könnten mehrere wartende Pool-Worker die Worker blockieren, die
+        für die eigentlichen Geräte-Reads gebraucht werden.
+        """
+        if not self._snapshot_lock.acquire(blocking=False):
+            return
+        try:
+            self._update_instant_snapshot_locked()
+        finally:
+            self._snapshot_lock.release()
+
+    def _device_failed(self, key: str) -> None:
+        """
+        Fehler-Backoff für ein Gerät fortschreiben: Verdopplung bis zum
+        Cap, nächster Read erst nach Ablauf der Backoff-Zeit.
+        """
+        backoff = min(
+            self._backoff[key] * 2 or DEVICE_BACKOFF_MIN_SEC,
+            DEVICE_BACKOFF_MAX_SEC,
+        )
+        self._backoff[key] = backoff
+        self._next_ok[key] = time.monotonic() + backoff
+        log.debug(f"{key} read failed – backing off {backoff}s")
+
+    def _update_instant_snapshot_locked(self) -> None:
         pv_kw = None
         pv1_kw = None
         pv2_kw = None
@@ -172,72 +400,107 @@ class AppState:
         grid_kw = None
         wb_kw = None
 
-        # PV
-        try:
-            pv_kw = self.pv_inv.read_total_power_kw()
-            string_powers = self.pv_inv.read_string_powers_kw()
-            pv1_kw = string_powers.get("pv1_kw")
-            pv2_kw = string_powers.get("pv2_kw")
-            pv3_kw = string_powers.get("pv3_kw")
-        except PVInverterError as e:
-            print(f"[Debug] PV read error: {e}")
-
-        # Grid
-        try:
-            grid_kw = self.grid_meter.read_power_kw()
-        except GridMeterError as e:
-            print(f"[Debug] Grid read error: {e}")
-
-        # Wallbox-Leistung
-        try:
-            wb_kw = self.wb.read_power_kw()
-        except WallboxError as e:
-            print(f"[Debug] WB read error: {e}")
-            wb_kw = None
+        # Alle Geräte-Reads parallel anstoßen (unabhängige Roundtrips).
+        # Geräte im Fehler-Backoff werden übersprungen, statt pro Tick
+        # erneut ins Timeout zu laufen. Die WB-Leistung steckt bereits in
+        # der go-e-Status-Antwort ('nrg'); der separate Modbus-Read läuft
+        # nur noch als Fallback, wenn kein Charger-Client verfügbar ist.
+        now_mono = time.monotonic()
+        next_ok = self._next_ok
+
+        pv_fut = None
+        if now_mono >= next_ok["pv"]:
+            pv_fut = self._io_pool.submit(self._read_pv)
+        grid_fut = None
+        if now_mono >= next_ok["grid"]:
+            grid_fut = self._io_pool.submit(self.grid_meter.read_power_kw)
+        charger_fut = None
+        wb_fut = None
+        if self.charger is not None:
+            if now_mono >= next_ok["charger"]:
+                charger_fut = self._io_pool.submit(self.charger.get_status_min)
+        elif now_mono >= next_ok["wb"]:
+            wb_fut = self._io_pool.submit(self.wb.read_power_kw)
 
-        # Live p_available_now berechnen
-        p_available_now = None
-        try:
-            if grid_kw is not None and wb_kw is not None:
-                # gleiche Definition wie im Controller, aber auf Momentanwerten:
-                # P_pv ≈ P_wb - P_grid; P_available = max(0, P_pv - deltaP)
-                p_raw = wb_kw - grid_kw
-                p_available_now = max(0.0, p_raw - self.controller.params.deltaP)
-        except Exception as e:
-            print(f"[Debug] p_available_now calc error: {e}")
+        # PV (Span-Read mit einmaligem Retry im Task → doppeltes Budget)
+        if pv_fut is not None:
+            try:
+                pv_kw, string_powers = pv_fut.result(timeout=2 * DEVICE_READ_TIMEOUT_SEC)
+                pv1_kw = string_powers.get("pv1_kw")
+                pv2_kw = string_powers.get("pv2_kw")
+                pv3_kw = string_powers.get("pv3_kw")
+                self._backoff["pv"] = 0
+            except (PVInverterError, FuturesTimeout) as e:
+                log.debug(f"PV read error: {e}")
+                self._device_failed("pv")
 
-        # Live Phase / Strom / Fahrzeugstatus
+        # Grid
+        if grid_fut is not None:
+            try:
+                grid_kw = grid_fut.result(timeout=DEVICE_READ_TIMEOUT_SEC)
+                self._last_grid_kw = grid_kw
+                self._last_grid_kw_ts = time.monotonic()
+                self._backoff["grid"] = 0
+            except (GridMeterError, FuturesTimeout) as e:
+                log.debug(f"Grid read error: {e}")
+                self._device_failed("grid")
+
+        # Live Phase / Strom / Fahrzeugstatus / WB-Leistung: alles aus
+        # der einen go-e-Status-Antwort (ein Roundtrip statt zwei)
         phase_live = None
         current_live = None
         car_state = None
 
-        if self.charger is not None:
+        if charger_fut is not None:
             try:
                 # minimale, normalisierte Sicht auf den Status holen
-                st = self.charger.get_status_min()
+                st = charger_fut.result(timeout=DEVICE_READ_TIMEOUT_SEC)
+                self._last_charger_status = st
+                self._last_charger_status_ts = time.monotonic()
                 car_state = st.car_state
                 phase_live = st.phase_mode      # 1 oder 3
                 current_live = st.ampere_allowed
-            except SimpleGoEClientError as e:
-                print(f"[Debug] Charger status error: {e}")
-        else:
-            # z.B. auf dem Pi, falls SimpleGoEClient nicht initialisiert werden konnte
-            print("[Debug] Charger object is None – no live phase/current read")
+                wb_kw = st.power_kw
+                self._backoff["charger"] = 0
+            except (SimpleGoEClientError, FuturesTimeout) as e:
+                log.debug(f"Charger status error: {e}")
+                self._device_failed("charger")
+        elif wb_fut is not None:
+            # z.B. auf dem Pi, falls SimpleGoEClient nicht initialisiert
+            # werden konnte: WB-Leistung direkt per Modbus lesen
+            try:
+                wb_kw = wb_fut.result(timeout=DEVICE_READ_TIMEOUT_SEC)
+                self._backoff["wb"] = 0
+            except (WallboxError, FuturesTimeout) as e:
+                log.debug(f"WB read error: {e}")
+                wb_kw = None
+                self._device_failed("wb")
+
+        # Live p_available_now: gleiche Definition wie im Controller, aber
+        # auf Momentanwerten (P_pv ≈ P_wb - P_grid). Reine Float-Arithmetik
+        # auf geprüften Werten — das frühere try/except-Gerüst pro Tick
+        # konnte nur durch die (jetzt gecachte) Attributkette auslösen.
+        p_available_now = (
+            max(0.0, wb_kw - grid_kw - self._deltaP)
+            if (grid_kw is not None and wb_kw is not None)
+            else None
+        )
 
-        # Status aktualisieren
-        with self.lock:
-            self.status["timestamp"] = datetime.now().isoformat(timespec="seconds")
-            self.status["pv_kw"] = pv_kw
-            self.status["pv1_kw"] = pv1_kw
-            self.status["pv2_kw"] = pv2_kw
-            self.status["pv3_kw"] = pv3_kw
-            self.status["grid_kw"] = grid_kw
-            self.status["wb_kw"] = wb_kw
-            self.status["car_state"] = car_state
-            self.status["p_available_now"] = p_available_now
-            self.status["phase"] = phase_live
-            self.status["current"] = current_live
-            # grid_kw_avg, wb_kw_avg, p_available_kw werden im Control-Step gesetzt
+        # Status aktualisieren (Copy-on-Write-Swap via _patch_status);
+        # grid_kw_avg, wb_kw_avg, p_available_kw gehören dem Control-Step
+        self._patch_status(
+            timestamp=datetime.now().isoformat(timespec="seconds"),
+            pv_kw=pv_kw,
+            pv1_kw=pv1_kw,
+            pv2_kw=pv2_kw,
+            pv3_kw=pv3_kw,
+            grid_kw=grid_kw,
+            wb_kw=wb_kw,
+            car_state=car_state,
+            p_available_now=p_available_now,
+            phase=phase_live,
+            current=current_live,
+        )
 
 
     def update_car_status(self) -> None:
@@ -248,53 +511,61 @@ class AppState:
         Diese Methode ist defensiv implementiert:
         - Wenn kein CarClient vorhanden ist -> sofortiger Rücksprung.
         - CarClientError wird abgefangen und als car_status_valid=False markiert.
-        - Unerwartete Exceptions werden mit traceback geloggt, car_status_valid=False.
+        - Unerwartete Exceptions werden mit Stacktrace geloggt, car_status_valid=False.
         """
         # Kein CarClient? -> nichts tun
         if self.car_client is None:
             # Debug-Info für Entwicklung; später ggf. kommentieren
-            print("[Debug] update_car_status: no CarClient, skipping.")
+            log.debug("update_car_status: no CarClient, skipping.")
             return
 
-        print("[Debug] update_car_status: calling car_client.read_status()")
+        log.debug("update_car_status: calling car_client.read_status()")
 
         try:
             cs = self.car_client.read_status()
-            print(
-                f"[Debug] update_car_status: CarStatus received: "
+            log.debug(
+                f"update_car_status: CarStatus received: "
                 f"soc={cs.soc}, autonomy={cs.autonomy_km}, "
                 f"plug={cs.plug_status}, charging={cs.charging_status}, "
                 f"timestamp={cs.timestamp}"
             )
         except CarClientError as e:
-            print(f"[Warn] CarClient error: {e}")
-            with self.lock:
-                self.status["car_status_valid"] = False
-                self.status["car_status_last_attempt"] = datetime.now().isoformat()
+            log.warning(f"CarClient error: {e}")
+            self._patch_status(
+                car_status_valid=False,
+                car_status_last_attempt=datetime.now().isoformat(),
+            )
             return
         except Exception:
-            print("[Error] Unexpected exception in update_car_status:")
-            traceback.print_exc()
-            with self.lock:
-                self.status["car_status_valid"] = False
-                self.status["car_status_last_attempt"] = datetime.now().isoformat()
+            log.exception("Unexpected exception in update_car_status")
+            self._patch_status(
+                car_status_valid=False,
+                car_status_last_attempt=datetime.now().isoformat(),
+            )
             return
 
         # ------------------------------------------------------------------
         # Basis-Fahrzeugstatus im gemeinsamen Status-Dict aktualisieren
         # ------------------------------------------------------------------
+        # ISO-String fürs Dashboard plus Float-Epoch für die Altersprüfung
+        # (erspart check_battery_saving_stop das fromisoformat-Parsen)
         ts_iso: str | None = None
+        ts_epoch: float | None = None
         if cs.timestamp is not None:
             ts_iso = cs.timestamp.isoformat()
-
-        with self.lock:
-            self.status["car_soc"] = cs.soc
-            self.status["car_autonomy_km"] = cs.autonomy_km
-            self.status["car_plug_status"] = cs.plug_status
-            self.status["car_charging_status"] = cs.charging_status
-            self.status["car_status_timestamp"] = ts_iso
-            self.status["car_status_valid"] = True
-            self.status["car_status_last_attempt"] = datetime.now().isoformat()
+            ts_epoch = cs.timestamp.timestamp()
+
+        self._patch_status(
+            car_soc=cs.soc,
+            car_autonomy_km=cs.autonomy_km,
+            car_plug_status=cs.plug_status,
+            car_charging_status=cs.charging_status,
+            car_status_timestamp=ts_iso,
+            car_status_ts_epoch=ts_epoch,
+            car_status_valid=True,
+            car_status_last_attempt=datetime.now().isoformat(),
+        )
+        self._car_status_mono_ts = time.monotonic()
 
         # ------------------------------------------------------------------
         # SoC-Anker für Schätzung setzen (nur wenn genügend Infos vorliegen)
@@ -303,16 +574,16 @@ class AppState:
             try:
                 connected = self.wb.is_vehicle_connected()
             except WallboxError as e:
-                print(f"[Warn] Wallbox error in SoC anchor check: {e}")
+                log.warning(f"Wallbox error in SoC anchor check: {e}")
                 connected = False
 
             wh_now: float | None = None
             if connected and self.charger is not None:
                 try:
                     wh_now = self.charger.get_energy_since_connected_wh()
-                    print(f"[Debug] update_car_status: wh_now={wh_now}")
+                    log.debug(f"update_car_status: wh_now={wh_now}")
                 except SimpleGoEClientError as e:
-                    print(f"[Warn] Error reading 'wh' for SoC anchor: {e}")
+                    log.warning(f"Error reading 'wh' for SoC anchor: {e}")
                     wh_now = None
 
             # Bisherigen Ankerzustand lesen
@@ -347,31 +618,70 @@ class AppState:
                         self.energy_since_anchor_Wh = 0.0
                         self.last_wh_since_connected = wh_now
                         self.soc_estimated = cs.soc
-                        self.status["car_soc_est"] = cs.soc
+                    self._patch_status(car_soc_est=cs.soc)
 
-                    print(
+                    log.info(
                         f"[SoC] New anchor set: SoC={cs.soc:.1f} %, "
                         f"ts={cs.timestamp.isoformat()}, wh={wh_now:.1f}"
                     )
                 else:
                     # Timestamp ist nicht neuer – Anker bleibt unverändert
-                    print(
-                        "[Debug] update_car_status: existing anchor kept "
+                    log.debug(
+                        "update_car_status: existing anchor kept "
                         f"(old_ts={old_anchor_ts}, new_ts={cs.timestamp})"
                     )
             else:
-                print(
-                    "[Debug] update_car_status: SoC anchor not set "
+                log.debug(
+                    "update_car_status: SoC anchor not set "
                     "(connected=%s, wh_now=%r, soc=%r, ts=%r)"
                     % (connected, wh_now, cs.soc, cs.timestamp)
                 )
 
         except Exception:
-            print("[Error] Unexpected exception in SoC anchor logic (update_car_status):")
-            traceback.print_exc()
+            log.exception("Unexpected exception in SoC anchor logic (update_car_status)")
 
 
 
+    def _maybe_refresh_car_status(self) -> None:
+        """
+        Stale-while-revalidate: ist der Fahrzeugstatus älter als der
+        weiche TTL, wird ein Hintergrund-Refresh im _io_pool angestoßen.
+
+        Der Aufrufer rechnet im aktuellen Tick mit dem (alten) Cache-Wert
+        weiter; blockiert wird nie. Zu alte Werte (harter TTL) sortiert
+        die Altersprüfung in check_battery_saving_stop ohnehin aus. Im
+        Normalbetrieb hält der Fahrzeugstatus-Thread den Cache frisch —
+        dieser Pfad greift vor allem nach fehlgeschlagenen Cloud-Calls.
+        """
+        if self.car_client is None:
+            return
+
+        if time.monotonic() - self._car_status_mono_ts <= CAR_STATUS_SOFT_TTL_SEC:
+            return
+
+        fut = self._car_refresh_future
+        if fut is not None and not fut.done():
+            return
+
+        self._car_refresh_future = self._io_pool.submit(self.update_car_status)
+
+    @staticmethod
+    def _iso_age_sec(ts_str) -> float | None:
+        """
+        Fallback-Altersbestimmung über den ISO-String (nur nötig, wenn
+        kein Epoch-Zeitstempel im Status steht, z.B. bei von Hand
+        gesetzten Feldern in Tests).
+        """
+        if not ts_str:
+            return None
+        try:
+            ts = datetime.fromisoformat(ts_str)
+        except Exception:
+            return None
+
+        now = datetime.now(ts.tzinfo) if ts.tzinfo is not None else datetime.now()
+        return (now - ts).total_seconds()
+
     def check_battery_saving_stop(self) -> tuple[bool, float | None]:
         """
         Entscheidet, ob aus Batterieschutz-Gründen die Ladung gestoppt werden soll.
@@ -390,74 +700,59 @@ class AppState:
 
         soc_value ist der SoC, der für die Entscheidung herangezogen wurde
         (zuerst realer SoC, sonst ggf. geschätzter SoC, sonst None).
+
+        Der heiße Pfad (Epoch-Zeitstempel vorhanden) besteht nur aus
+        Float-Vergleichen in einer Short-Circuit-Kette — kein datetime-
+        Parsen und kein Exception-Gerüst pro Aufruf.
         """
+        # Lockfreier Lese-Snapshot: eine Referenz ziehen, dann nur noch
+        # auf dem Snapshot arbeiten
+        st = self.status
+        est_soc = st.get("car_soc_est")
+        raw_soc = st.get("car_soc")
+        ts_epoch = st.get("car_status_ts_epoch")
+        valid = st.get("car_status_valid", False)
 
-        battery_saving_stop = False
         soc_value: float | None = None
 
-        try:
-            with self.lock:
-                est_soc = self.status.get("car_soc_est")
-                raw_soc = self.status.get("car_soc")
-                ts_str = self.status.get("car_status_timestamp")
-                valid = self.status.get("car_status_valid", False)
-
-            # ----------------------------------------------------------
-            # 1) Vorrangig: realer Renault-SoC mit Altersprüfung
-            # ----------------------------------------------------------
-            if isinstance(raw_soc, (int, float)):
-                soc_real_f = float(raw_soc)
-                soc_value = soc_real_f  # wird auch im Fehler-/No-Stop-Fall zurückgegeben
-
-                # Nur wenn Status gültig und Timestamp vorhanden, kann ein Stopp erfolgen
-                if valid and ts_str:
-                    try:
-                        ts = datetime.fromisoformat(ts_str)
-                    except Exception:
-                        ts = None
+        # ------------------------------------------------------------------
+        # 1) Vorrangig: realer Renault-SoC mit Altersprüfung
+        # ------------------------------------------------------------------
+        if isinstance(raw_soc, (int, float)):
+            soc_real_f = float(raw_soc)
+            soc_value = soc_real_f  # wird auch im No-Stop-Fall zurückgegeben
 
-                    if ts is not None:
-                        if ts.tzinfo is not None:
-                            now = datetime.now(ts.tzinfo)
-                        else:
-                            now = datetime.now()
+            if isinstance(ts_epoch, (int, float)):
+                age_sec = time.time() - float(ts_epoch)
+            else:
+                age_sec = self._iso_age_sec(st.get("car_status_timestamp"))
 
-                        age_sec = (now - ts).total_seconds()
-                    else:
-                        age_sec = None
-
-                    # Daten müssen frisch sein
-                    if (
-                        age_sec is not None
-                        and 0.0 <= age_sec <= BATTERY_SAVING_MAX_AGE_SEC
-                        and 0.0 <= soc_real_f <= 100.0
-                        and soc_real_f >= BATTERY_SAVING_SOC_LIMIT
-                    ):
-                        return True, soc_real_f
-                # Falls valid=False, kein Timestamp oder zu alt:
-                # kein Stopp, aber soc_value bleibt gesetzt
-
-            # ----------------------------------------------------------
-            # 2) Falls kein Stopp durch realen SoC: geschätzten SoC prüfen
-            # ----------------------------------------------------------
-            if isinstance(est_soc, (int, float)):
-                soc_est_f = float(est_soc)
-
-                # Wenn bisher kein soc_value gesetzt wurde, diesen hier verwenden
-                if soc_value is None:
-                    soc_value = soc_est_f
-
-                if 0.0 <= soc_est_f <= 100.0 and soc_est_f >= BATTERY_SAVING_SOC_LIMIT:
-                    return True, soc_est_f
-
-            # ----------------------------------------------------------
-            # Kein Stopp, soc_value ggf. aus realem oder geschätztem SoC
-            # ----------------------------------------------------------
-            return False, soc_value
+            # Billige Prädikate zuerst; die Kette bricht beim ersten
+            # False ab (Short-Circuit)
+            if (
+                valid
+                and age_sec is not None
+                and 0.0 <= age_sec <= BATTERY_SAVING_MAX_AGE_SEC
+                and 0.0 <= soc_real_f <= 100.0
+                and soc_real_f >= BATTERY_SAVING_SOC_LIMIT
+            ):
+                return True, soc_real_f
+            # Falls valid=False, kein Timestamp oder zu alt:
+            # kein Stopp, aber soc_value bleibt gesetzt
 
-        except Exception as e:
-            print(f"[Debug] battery_saving_stop evaluation error: {e}")
-            return False, None
+        # ------------------------------------------------------------------
+        # 2) Falls kein Stopp durch realen SoC: geschätzten SoC prüfen
+        # ------------------------------------------------------------------
+        if isinstance(est_soc, (int, float)):
+            soc_est_f = float(est_soc)
+
+            if soc_value is None:
+                soc_value = soc_est_f
+
+            if 0.0 <= soc_est_f <= 100.0 and soc_est_f >= BATTERY_SAVING_SOC_LIMIT:
+                return True, soc_est_f
+
+        return False, soc_value
 
 
 
@@ -489,7 +784,7 @@ class AppState:
             try:
                 connected = self.wb.is_vehicle_connected()
             except WallboxError as e:
-                print(f"[Warn] Wallbox error in SoC estimation: {e}")
+                log.warning(f"Wallbox error in SoC estimation: {e}")
                 connected = False
 
             if not connected:
@@ -500,8 +795,8 @@ class AppState:
                     self.energy_since_anchor_Wh = None
                     self.last_wh_since_connected = None
                     self.soc_estimated = None
-                    self.status["car_soc_est"] = None
-                print("[SoC] Vehicle not connected – resetting SoC estimator.")
+                self._patch_status(car_soc_est=None)
+                log.info("[SoC] Vehicle not connected – resetting SoC estimator.")
                 return
 
             # Need charger and 'wh'
@@ -511,7 +806,7 @@ class AppState:
             try:
                 wh_now = self.charger.get_energy_since_connected_wh()
             except SimpleGoEClientError as e:
-                print(f"[Warn] Error reading 'wh' from charger: {e}")
+                log.warning(f"Error reading 'wh' from charger: {e}")
                 return
 
             if wh_now is None:
@@ -525,8 +820,8 @@ class AppState:
 
                 if delta_raw < -1.0:
                     # Counter reset or suspicious behaviour -> drop estimator
-                    print(
-                        f"[Warn] go-e 'wh' decreased "
+                    log.warning(
+                        f"go-e 'wh' decreased "
                         f"(last={last_wh:.1f}, now={wh_now:.1f}) – resetting SoC estimator."
                     )
                     with self.lock:
@@ -535,7 +830,7 @@ class AppState:
                         self.energy_since_anchor_Wh = None
                         self.last_wh_since_connected = wh_now
                         self.soc_estimated = None
-                        self.status["car_soc_est"] = None
+                    self._patch_status(car_soc_est=None)
                     return
                 elif delta_raw < 0.0:
                     deltaE_Wh = 0.0
@@ -562,73 +857,117 @@ class AppState:
                 self.energy_since_anchor_Wh = energy_since_anchor_Wh
                 self.last_wh_since_connected = wh_now
                 self.soc_estimated = soc_est
-                self.status["car_soc_est"] = soc_est
+            self._patch_status(car_soc_est=soc_est)
 
-            print(
+            log.info(
                 f"[SoC] Estimated SoC={soc_est:.1f} % "
                 f"(anchor={soc_anchor:.1f} %, "
                 f"energy_since_anchor={energy_since_anchor_Wh:.1f} Wh)"
             )
 
         except Exception as e:
-            print(f"[Warn] Error in update_soc_estimate: {e}")
+            log.warning(f"Error in update_soc_estimate: {e}")
 
     # ------------------------------------------------------------------
     # Hauptschleife (Background-Thread)
     # ------------------------------------------------------------------
     def run_loop(self):
+        # Drift-freier Takt: die Deadline wird pro Tick um das Intervall
+        # fortgeschrieben (next_tick += ...), nicht neu ab "jetzt"
+        # berechnet. Langsame Geräte-Reads verzögern so nur den einen
+        # Tick, statt die 5-Minuten-Regelperiode kumulativ zu verschieben.
+        next_tick = time.monotonic()
+
+        # Invariante Lookups einmal binden (LOAD_FAST statt wiederholter
+        # LOAD_ATTR-Ketten in einer Schleife, die tagelang läuft)
+        grid_samples = self.grid_samples
+        grid_meter = self.grid_meter
+        wb = self.wb
+        controller = self.controller
+        grid_period = GRID_SAMPLE_EVERY * SAMPLE_INTERVAL_SEC
+        control_period = CONTROL_PERIOD * SAMPLE_INTERVAL_SEC
+        soc_period = BATTERY_SAVING_CHECK_PERIOD * SAMPLE_INTERVAL_SEC
+
         while True:
+            deep_idle = False
             try:
 
-                # Live snapshot for dashboard
-                self.update_instant_snapshot()
+                # Live snapshot nur, wenn das Dashboard zuschaut: ohne
+                # Clients spart das vier Geräte-Polls pro Tick. Regelung,
+                # Grid-Mittelung und SoC-Check laufen unabhängig weiter
+                # (mit direktem Grid-Read als Fallback).
+                idle = (
+                    self._sse_clients == 0
+                    and time.monotonic() - self._last_client_poll_ts
+                    > IDLE_POLL_TIMEOUT_SEC
+                )
+                if not idle:
+                    self.update_instant_snapshot()
 
-                # ----------------------------------------------------------
-                # Grid samples for averaging (based on grid_counter)
-                # ----------------------------------------------------------
-                if self.grid_counter == 0:
-                    try:
-                        g = self.grid_meter.read_power_kw()
-                        self.grid_samples.append(g)
-                    except GridMeterError as e:
-                        print(f"[Warn] GridMeter error (avg): {e}")
+                # Ohne Zuschauer und ohne angestecktes Auto gibt es nichts
+                # zu regeln und nichts anzuzeigen: Takt strecken (s.u.)
+                deep_idle = idle and self.status.get("car_plug_status") == 0
 
-                    if len(self.grid_samples) > MAX_GRID_SAMPLES:
-                        self.grid_samples = self.grid_samples[-MAX_GRID_SAMPLES:]
+                now = time.monotonic()
 
                 # ----------------------------------------------------------
-                # Update car status periodically (Renault API)
-                # based on car_status_counter
+                # Grid samples for averaging (own monotonic schedule)
                 # ----------------------------------------------------------
-                if self.car_status_counter == 0:
-                    self.update_car_status()
-                    
-
-                # Query mode
-                mode = self.get_mode()
-
-                # Check flag for fresh mode switch (under lock)
+                if now >= self._next_grid_sample_t:
+                    while self._next_grid_sample_t <= now:
+                        self._next_grid_sample_t += grid_period
+                    # Frischen Grid-Wert aus dem Snapshot wiederverwenden
+                    # statt den Zähler ein zweites Mal abzufragen; nur bei
+                    # veraltetem Wert (z.B. Snapshot-Fehler) direkt lesen.
+                    g = self._last_grid_kw
+                    fresh = (
+                        g is not None
+                        and time.monotonic() - self._last_grid_kw_ts
+                        < 2 * SAMPLE_INTERVAL_SEC
+                    )
+                    if not fresh:
+                        try:
+                            g = grid_meter.read_power_kw()
+                        except GridMeterError as e:
+                            g = None
+                            log.warning(f"GridMeter error (avg): {e}")
+
+                    if g is not None:
+                        grid_samples.append(g)
+
+                # Einen Status-Snapshot pro Tick ziehen (lockfrei) und
+                # alle benötigten Felder daraus lesen; nur das
+                # just_switched-Flag braucht das Schreiber-Lock
+                # Direkte Index-Zugriffe statt .get(): die Keys werden in
+                # __init__ angelegt und von _patch_status nie entfernt
+                st = self.status
+                mode = st["mode"]
+                soc_protection = st["soc_protection"]
+                current_phase = st["phase"]
                 with self.lock:
                     just_switched = self.just_switched_to_pv
-                    soc_protection = self.status.get("soc_protection", True)
-                    current_phase = self.status.get("phase")
 
                 # Condition for PV surplus controller activation
-                # CONTROL_PERIOD is interpreted as number of loop ticks
                 trigger_control = (
                     mode == "pv_surplus"
-                    and self.grid_samples
-                    and (self.control_counter == CONTROL_PERIOD - 1 or just_switched)
+                    and grid_samples
+                    and (now >= self._next_control_t or just_switched)
                 )
 
                 # Condition for SoC-check in monitor_only mode
-                # BATTERY_SAVING_CHECK_PERIOD is in loop ticks, not seconds
                 soc_control = (
                     soc_protection
                     and mode == "monitor_only"
-                    and (self.soc_counter == 0)
+                    and now >= self._next_soc_check_t
                 )
 
+                # Fällige Deadlines fortschreiben (unabhängig davon, ob
+                # der jeweilige Pfad im aktuellen Modus aktiv war)
+                while self._next_control_t <= now:
+                    self._next_control_t += control_period
+                while self._next_soc_check_t <= now:
+                    self._next_soc_check_t += soc_period
+
                 # ----------------------------------------------------------
                 # Unified SoC-check (only once per loop if relevant)
                 # SoC estimation is only updated if there is a reason to 
@@ -638,6 +977,10 @@ class AppState:
                 soc_value = None
 
                 if soc_protection and (trigger_control or soc_control):
+                    # Veralteten Fahrzeugstatus im Hintergrund auffrischen
+                    # (stale-while-revalidate, blockiert nicht)
+                    self._maybe_refresh_car_status()
+
                     # Update SoC estimation before evaluating protection
                     self.update_soc_estimate()
 
@@ -647,25 +990,25 @@ class AppState:
                 # PV Surplus Controller
                 # ----------------------------------------------------------
                 if trigger_control:
-                    grid_avg_kw = sum(self.grid_samples) / len(self.grid_samples)
+                    grid_avg_kw = grid_samples.mean()
 
                     try:
-                        wb_kw_avg = self.wb.read_power_kw()
+                        wb_kw_avg = wb.read_power_kw()
                     except WallboxError as e:
                         wb_kw_avg = 0.0
-                        print(f"[Warn] Wallbox power read error (avg): {e}")
+                        log.warning(f"Wallbox power read error (avg): {e}")
 
-                    result = self.controller.step(grid_kw=grid_avg_kw, wb_kw=wb_kw_avg)
+                    result = controller.step(grid_kw=grid_avg_kw, wb_kw=wb_kw_avg)
 
                     # Apply battery saving inside surplus mode
                     if battery_saving_stop:
-                        print(
+                        log.info(
                             f"[Control] Battery-saving stop active "
                             f"(SoC={soc_value:.1f} %) – forcing current to 0 A."
                         )
                         result["current"] = 0
 
-                    print(
+                    log.info(
                         f"[5min] Grid_avg: {grid_avg_kw:6.2f} kW | "
                         f"WB_avg: {wb_kw_avg:6.2f} kW | "
                         f"P_avail: {result['p_available_kw']:6.2f} kW | "
@@ -674,10 +1017,12 @@ class AppState:
 
                     # Update status
                     with self.lock:
-                        self.status["grid_kw_avg"] = grid_avg_kw
-                        self.status["wb_kw_avg"] = wb_kw_avg
-                        self.status["p_available_kw"] = result["p_available_kw"]
                         self.just_switched_to_pv = False
+                    self._patch_status(
+                        grid_kw_avg=grid_avg_kw,
+                        wb_kw_avg=wb_kw_avg,
+                        p_available_kw=result["p_available_kw"],
+                    )
 
                     # Apply decision to wallbox
                     self.apply_charger_decision(
@@ -686,13 +1031,13 @@ class AppState:
                     )
 
                     # Reset averaging buffer
-                    self.grid_samples = []
+                    grid_samples.clear()
 
                 # ----------------------------------------------------------
                 # SoC protection in monitor_only mode (no PV control)
                 # ----------------------------------------------------------
                 if soc_control and battery_saving_stop:
-                    print(
+                    log.info(
                         f"[Control] Battery-saving stop (monitor_only, "
                         f"SoC={soc_value:.1f} %) – forcing current to 0 A."
                     )
@@ -708,22 +1053,69 @@ class AppState:
                         current_new=0
                     )
 
-                # ----------------------------------------------------------
-                # Advance all loop counters (in ticks, not seconds)
-                # ----------------------------------------------------------
-                self.grid_counter = (self.grid_counter + 1) % GRID_SAMPLE_EVERY
-                self.control_counter = (self.control_counter + 1) % CONTROL_PERIOD
-                self.soc_counter = (self.soc_counter + 1) % BATTERY_SAVING_CHECK_PERIOD
-                self.car_status_counter = (self.car_status_counter + 1) % CAR_STATUS_PERIOD
-
+            except (
+                GridMeterError,
+                PVInverterError,
+                WallboxError,
+                SimpleGoEClientError,
+                CarClientError,
+            ) as e:
+                # Erwartbare Geräte-/API-Fehler: loggen und weitertakten
+                log.warning("device error in main loop: %s", e)
             except Exception:
-                print("[Error] main loop exception:")
-                traceback.print_exc()
+                # Unerwartete Fehler strukturiert (mit Stacktrace) loggen
+                # und mit Backoff weiterlaufen, statt sie still im 1-Hz-
+                # Takt zu wiederholen
+                log.exception("unexpected error in main loop – backing off 5 s")
+                time.sleep(5.0)
+
+            # Im Tief-Idle das Raster grob halten (Vielfache des
+            # Intervalls), damit Deadlines beim Aufwachen sauber greifen
+            next_tick += (IDLE_TICK_STRETCH if deep_idle else 1) * SAMPLE_INTERVAL_SEC
+            now = time.monotonic()
+            sleep_for = next_tick - now
+
+            if sleep_for <= 0.0:
+                # Tick hat das Intervall überzogen: verpasste Deadlines
+                # arithmetisch überspringen (die Phase des Rasters bleibt
+                # erhalten), statt sie in Null-Sleep-Bursts nachzuholen.
+                missed = 1 + int(-sleep_for // SAMPLE_INTERVAL_SEC)
+                next_tick += missed * SAMPLE_INTERVAL_SEC
+                log.warning(
+                    f"run_loop overran its {SAMPLE_INTERVAL_SEC}s "
+                    f"interval – skipping {missed} tick(s) to resync."
+                )
+                sleep_for = next_tick - now
 
-            time.sleep(SAMPLE_INTERVAL_SEC)
+            time.sleep(sleep_for)
 
 
 
+    # ------------------------------------------------------------------
+    # Fahrzeugstatus-Schleife (eigener Thread)
+    # ------------------------------------------------------------------
+    def run_car_status_loop(self):
+        """
+        Fragt den Renault-Fahrzeugstatus periodisch in einem eigenen
+        Thread ab. Der Cloud-API-Call kann mehrere Sekunden dauern —
+        im Haupt-Loop würde er solange alle Live-Werte (PV/Grid/WB)
+        einfrieren lassen.
+        """
+        while True:
+            try:
+                self.update_car_status()
+            except Exception:
+                log.exception("car status loop exception")
+
+            # Stale-while-revalidate mit langem TTL: ist das Auto
+            # abgesteckt (plug_status == 0), ändert sich der SoC nicht —
+            # dann deutlich seltener pollen. Beim Wiederanstecken holt
+            # der Soft-TTL-Refresh des Regelpfads den Status zeitnah.
+            sleep_sec = CAR_STATUS_PERIOD * SAMPLE_INTERVAL_SEC
+            if self.status.get("car_plug_status") == 0:
+                sleep_sec *= CAR_STATUS_UNPLUGGED_FACTOR
+            time.sleep(sleep_sec)
+
     # ------------------------------------------------------------------
     # Entscheidung an die go-e-Charger-API weitergeben
     # ------------------------------------------------------------------
@@ -735,20 +1127,26 @@ class AppState:
 
         # Falls kein Charger verfügbar ist (z.B. auf einem System ohne Steuerung)
         if self.charger is None:
-            print("[Warn] No charger client available – skipping apply_charger_decision.")
+            log.warning("No charger client available – skipping apply_charger_decision.")
             return
 
-        # Aktuellen Zustand lesen
+        # Aktuellen Zustand lesen: frischen Status aus dem Snapshot
+        # wiederverwenden, sonst einmal nachfragen
         try:
-            st = self.charger.get_status_min()
+            st = self._last_charger_status
+            if (
+                st is None
+                or time.monotonic() - self._last_charger_status_ts >= 1.5
+            ):
+                st = self.charger.get_status_min()
             car_state = st.car_state or "unknown"
             phase_current = st.phase_mode          # 1 oder 3 (oder None)
             current_current = st.ampere_allowed    # int oder None
         except SimpleGoEClientError as e:
-            print(f"[Warn] Error reading charger state: {e}")
+            log.warning(f"Error reading charger state: {e}")
             return
 
-        print(
+        log.info(
             f"[Control] car_state={car_state}, "
             f"phase_current={phase_current}, current_current={current_current}, "
             f"phase_new={phase_new}, current_new={current_new}"
@@ -756,7 +1154,7 @@ class AppState:
 
         # Keine sinnvollen Istwerte gefunden → lieber nichts tun
         if phase_current is None or current_current is None:
-            print("[Warn] Incomplete charger status (phase/current None) – skipping control action.")
+            log.warning("Incomplete charger status (phase/current None) – skipping control action.")
             return
 
         # 1) Ausgeschaltet lassen (keine Ladung, kein neuer Strom)
@@ -765,49 +1163,58 @@ class AppState:
 
         # 2) Ladung stoppen
         if car_state == "Charging" and current_new == 0:
+            # Bereits gesperrt? Dann keinen No-Op-Write schicken.
+            if st.allow_charging is False:
+                log.debug("Charging already disabled – skipping frc write.")
+                return
             try:
                 # hart stoppen
                 self.charger.set_charging_mode(False)  # → /api/set?frc=1
+                self._last_charger_status_ts = 0.0     # Cache invalidieren
             except SimpleGoEClientError as e:
-                print(f"[Warn] Error stopping charge: {e}")
+                log.warning(f"Error stopping charge: {e}")
             return
 
-        # 3) Ladung starten
+        # 3) Ladung starten: Phase, Strom und Freigabe in einem einzigen
+        #    kombinierten /api/set-Request (statt drei Roundtrips)
         if car_state not in ("Idle", "Charging") and current_new > 0:
             try:
-                # Phase einstellen
-                if phase_new == 1:
-                    self.charger.set_phase_mode(1)    # → /api/set?psm=1
-                else:
-                    self.charger.set_phase_mode(3)    # → /api/set?psm=2
-
-                # Strom einstellen
-                self.charger.set_ampere(current_new)  # → /api/set?amp=...
-
-                # Freigeben
-                self.charger.set_charging_mode(True)  # → /api/set?frc=0
+                # Nur tatsächlich geänderte Parameter mitschicken — die
+                # Freigabe (frc) ist hier immer nötig
+                params = {"frc": 2}
+                if phase_new != phase_current:
+                    params["psm"] = 1 if phase_new == 1 else 2
+                if current_new != current_current:
+                    params["amp"] = current_new
+                self.charger.set_many(**params)
+                self._last_charger_status_ts = 0.0     # Cache invalidieren
             except SimpleGoEClientError as e:
-                print(f"[Warn] Error starting charge: {e}")
+                log.warning(f"Error starting charge: {e}")
             return
 
         # 4) Ladung läuft, Parameter anpassen
         if car_state == "Charging" and current_new > 0:
             try:
-                # Phasenwechsel 1 -> 3
+                # Phasenwechsel: psm + amp gebündelt in einem Request
                 if phase_current == 1 and phase_new == 3:
-                    self.charger.set_phase_mode(3)
-                    self.charger.set_ampere(current_new)
+                    self.charger.set_many(psm=2, amp=current_new)
 
-                # Phasenwechsel 3 -> 1
                 elif phase_current == 3 and phase_new == 1:
-                    self.charger.set_phase_mode(1)
-                    self.charger.set_ampere(current_new)
+                    self.charger.set_many(psm=1, amp=current_new)
+
+                # Phase und Strom unverändert → kein Write (schont
+                # Roundtrips und das EEPROM der Box)
+                elif current_new == current_current:
+                    log.debug("Charger already at requested phase/current – no write.")
+                    return
 
                 # Phase gleich, nur Strom anpassen
                 else:
                     self.charger.set_ampere(current_new)
+
+                self._last_charger_status_ts = 0.0     # Cache invalidieren
             except SimpleGoEClientError as e:
-                print(f"[Warn] Error adjusting charge parameters: {e}")
+                log.warning(f"Error adjusting charge parameters: {e}")
 
 
 
@@ -821,26 +1228,85 @@ app = Flask(__name__)
 
 @app.route("/api/status", methods=["GET"])
 def api_status():
-    with app_state.lock:
-        return jsonify(app_state.status)
+    # Poll-Zeitstempel für die Idle-Erkennung des Loops; nach einer
+    # Idle-Phase sofort einen frischen Snapshot im Hintergrund anstoßen,
+    # damit nicht erst der nächste Tick wieder Live-Werte liefert.
+    now = time.monotonic()
+    was_idle = now - app_state._last_client_poll_ts > IDLE_POLL_TIMEOUT_SEC
+    app_state._last_client_poll_ts = now
+    if was_idle:
+        app_state._io_pool.submit(app_state._refresh_snapshot_nowait)
+
+    # Nur fertige Bytes ausliefern: serialisiert wird einmal pro
+    # Statusänderung in _publish_status(), nicht einmal pro Poll — und
+    # nie unter einem Lock; der Handler liest ausschließlich die atomar
+    # getauschten Attribut-Referenzen.
+    etag = app_state._status_etag
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+
+    # "private": Browser dürfen kurz cachen (ETag-Revalidierung greift),
+    # aber kein Proxy/Intermediary darf die Antwort clientübergreifend
+    # ausliefern — der Status ist pro Haushalt live.
+    return Response(
+        app_state._status_bytes,
+        mimetype="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, max-age=1"},
+    )
+
+
+@app.route("/api/stream", methods=["GET"])
+def api_stream():
+    """
+    Server-Sent Events: pusht den Status bei jeder Änderung genau einmal
+    pro Client, statt dass jeder offene Tab alle 2 s pollt.
+    """
+    def stream():
+        with app_state._status_cond:
+            app_state._sse_clients += 1
+        try:
+            # Reconnect-Intervall für den Browser (Standard wären 3 s);
+            # beim Abriss fällt das Frontend ohnehin auf Polling zurück
+            yield b"retry: 5000\n\n"
+            last = None
+            while True:
+                buf = app_state._status_bytes
+                if buf is not last:
+                    last = buf
+                    yield b"data: " + buf + b"\n\n"
+                else:
+                    # Kommentarzeile als Heartbeat (hält Proxies wach)
+                    yield b": keep-alive\n\n"
+
+                with app_state._status_cond:
+                    app_state._status_cond.wait(timeout=15.0)
+        finally:
+            with app_state._status_cond:
+                app_state._sse_clients -= 1
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.route("/api/mode", methods=["GET", "POST"])
 def api_mode():
     if request.method == "GET":
-        return jsonify({"mode": app_state.get_mode()})
+        return _json({"mode": app_state.get_mode()})
 
     data = request.get_json(silent=True) or {}
     mode = data.get("mode")
     if not mode:
-        return jsonify({"error": "mode is required"}), 400
+        return _json({"error": "mode is required"}, status=400)
 
     try:
         app_state.set_mode(mode)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return _json({"error": str(e)}, status=400)
 
-    return jsonify({"status": "ok", "mode": mode})
+    return _json({"status": "ok", "mode": mode})
 
 
 @app.route("/api/soc_protection", methods=["POST"])
@@ -853,17 +1319,21 @@ def api_soc_protection():
     value = data.get("value", None)
 
     if not isinstance(value, bool):
-        return jsonify({"error": "value must be a boolean"}), 400
+        return _json({"error": "value must be a boolean"}, status=400)
+
+    app_state._patch_status(soc_protection=value)
+
+    return _json({"status": "ok", "soc_protection": value})
 
-    with app_state.lock:
-        app_state.status["soc_protection"] = value
 
-    return jsonify({"status": "ok", "soc_protection": value})
+# Antwort ist statisch: einmal beim Import kodieren, pro Request nur
+# noch die fertigen Bytes ausliefern (gleiches Muster wie _status_bytes)
+_HEALTH_BYTES = _json_dumps({"status": "ok"})
 
 
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"status": "ok"})
+    return Response(_HEALTH_BYTES, mimetype="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -1153,99 +1623,86 @@ HTML_PAGE = """
     // Track current SoC protection state in frontend
     let socProtection = true;
 
+    // DOM-Referenzen einmal beim Laden auflösen (das Script steht am
+    // Ende des <body>, die Elemente existieren bereits), statt pro
+    // Update-Tick per getElementById zu suchen.
+    const els = {
+        timestamp: document.getElementById("timestamp"),
+        btnPv: document.getElementById("btn_pv"),
+        btnMonitor: document.getElementById("btn_monitor"),
+        btnSoc: document.getElementById("btn_soc"),
+        carState: document.getElementById("car_state"),
+        carSoc: document.getElementById("car_soc"),
+        carAutonomy: document.getElementById("car_autonomy"),
+        carPlugStatus: document.getElementById("car_plug_status"),
+        carChargingStatus: document.getElementById("car_charging_status"),
+        carStatusTimestamp: document.getElementById("car_status_timestamp"),
+        pv: document.getElementById("pv_kw"),
+        grid: document.getElementById("grid_kw"),
+        wb: document.getElementById("wb_kw"),
+        pav: document.getElementById("p_available_kw"),
+        pvStrings: document.getElementById("pv_strings"),
+        phase: document.getElementById("phase"),
+        current: document.getElementById("current"),
+    };
+
+    // textContent nur bei tatsächlicher Änderung schreiben — erspart
+    // dem Browser Style/Layout-Invalidierungen bei jedem Poll, obwohl
+    // sich meist nur ein oder zwei Werte geändert haben.
+    function setText(el, value) {
+        const text = String(value);
+        if (el && el.textContent !== text) {
+            el.textContent = text;
+        }
+    }
+
     function updateDashboard(data) {
         // Timestamp
-        const tsElem = document.getElementById("timestamp");
-        tsElem.textContent = data.timestamp || "–";
+        setText(els.timestamp, data.timestamp || "–");
 
         // Mode buttons
         const mode = data.mode || "unknown";
-        const btnPv = document.getElementById("btn_pv");
-        const btnMonitor = document.getElementById("btn_monitor");
-        const btnSoc = document.getElementById("btn_soc");
-
-        if (mode === "pv_surplus") {
-            if (btnPv && btnMonitor) {
-                btnPv.classList.add("active");
-                btnMonitor.classList.remove("active");
-            }
-        } else if (mode === "monitor_only") {
-            if (btnPv && btnMonitor) {
-                btnPv.classList.remove("active");
-                btnMonitor.classList.add("active");
-            }
-        } else {
-            if (btnPv && btnMonitor) {
-                btnPv.classList.remove("active");
-                btnMonitor.classList.remove("active");
-            }
+        if (els.btnPv && els.btnMonitor) {
+            els.btnPv.classList.toggle("active", mode === "pv_surplus");
+            els.btnMonitor.classList.toggle("active", mode === "monitor_only");
         }
 
         // SoC protection button (text + highlighting)
         if (typeof data.soc_protection === "boolean") {
             socProtection = data.soc_protection;
         }
-        if (btnSoc) {
-            if (socProtection) {
-                btnSoc.textContent = "SoC-Schutz: aktiv";
-                btnSoc.classList.add("active");
-            } else {
-                btnSoc.textContent = "SoC-Schutz: inaktiv";
-                btnSoc.classList.remove("active");
-            }
+        if (els.btnSoc) {
+            setText(els.btnSoc, socProtection ? "SoC-Schutz: aktiv" : "SoC-Schutz: inaktiv");
+            els.btnSoc.classList.toggle("active", socProtection);
         }
 
-
         // Car state
-        const carStateElem = document.getElementById("car_state");
-        carStateElem.textContent = data.car_state || "unbekannt";
+        setText(els.carState, data.car_state || "unbekannt");
 
         // Fahrzeugstatus
         if (data.car_soc != null) {
-            document.getElementById("car_soc").textContent = data.car_soc.toFixed
-                ? data.car_soc.toFixed(0)
-                : data.car_soc;
-        } else {
-            document.getElementById("car_soc").textContent = "–";
-        }
-
-        if (data.car_autonomy_km != null) {
-            document.getElementById("car_autonomy").textContent = data.car_autonomy_km;
+            setText(els.carSoc, data.car_soc.toFixed ? data.car_soc.toFixed(0) : data.car_soc);
         } else {
-            document.getElementById("car_autonomy").textContent = "–";
+            setText(els.carSoc, "–");
         }
 
-        document.getElementById("car_plug_status").textContent =
-            data.car_plug_status != null ? data.car_plug_status : "–";
-
-        document.getElementById("car_charging_status").textContent =
-            data.car_charging_status != null ? data.car_charging_status : "–";
-
-        document.getElementById("car_status_timestamp").textContent =
+        setText(els.carAutonomy, data.car_autonomy_km != null ? data.car_autonomy_km : "–");
+        setText(els.carPlugStatus, data.car_plug_status != null ? data.car_plug_status : "–");
+        setText(els.carChargingStatus,
+            data.car_charging_status != null ? data.car_charging_status : "–");
+        setText(els.carStatusTimestamp,
             data.car_status_timestamp != null
                 ? formatTimestampLocal(data.car_status_timestamp)
-                : "–";
-
-
+                : "–");
 
         // PV, Grid, WB, P_available_now
-        const pvElem = document.getElementById("pv_kw");
-        const gridElem = document.getElementById("grid_kw");
-        const wbElem = document.getElementById("wb_kw");
-        const pavElem = document.getElementById("p_available_kw");
-        const pvStringsElem = document.getElementById("pv_strings");
-
-        pvElem.textContent = formatKw(data.pv_kw);
-        gridElem.textContent = formatKw(data.grid_kw);
-        wbElem.textContent = formatKw(data.wb_kw);
-        pavElem.textContent = formatKw(data.p_available_now);
+        setText(els.pv, formatKw(data.pv_kw));
+        setText(els.grid, formatKw(data.grid_kw));
+        setText(els.wb, formatKw(data.wb_kw));
+        setText(els.pav, formatKw(data.p_available_now));
 
          // PV strings: short summary "1.2 / 0.3 / 1.5"
-        if (pvStringsElem) {
-            const v1 = data.pv1_kw;
-            const v2 = data.pv2_kw;
-            const v3 = data.pv3_kw;
-
+        if (els.pvStrings) {
             function fmtStringKw(val) {
                 if (val === null || val === undefined || typeof val !== "number" || isNaN(val)) {
                     return "-";
@@ -1253,44 +1710,59 @@ HTML_PAGE = """
                 return val.toFixed(2);
             }
 
-            const s1 = fmtStringKw(v1);
-            const s2 = fmtStringKw(v2);
-            const s3 = fmtStringKw(v3);
+            const s1 = fmtStringKw(data.pv1_kw);
+            const s2 = fmtStringKw(data.pv2_kw);
+            const s3 = fmtStringKw(data.pv3_kw);
 
             if (s1 === "-" && s2 === "-" && s3 === "-") {
-                pvStringsElem.textContent = "–";
+                setText(els.pvStrings, "–");
             } else {
-                pvStringsElem.textContent = `${s1} / ${s2} / ${s3}`;
+                setText(els.pvStrings, `${s1} / ${s2} / ${s3}`);
             }
         }
 
         // Grid color coding
-        gridElem.classList.remove("grid-positive", "grid-negative");
-        if (typeof data.grid_kw === "number") {
-            if (data.grid_kw > 0.05) {
-                gridElem.classList.add("grid-positive");  // Bezug
-            } else if (data.grid_kw < -0.05) {
-                gridElem.classList.add("grid-negative");  // Einspeisung
-            }
+        if (els.grid) {
+            const gridNum = typeof data.grid_kw === "number" ? data.grid_kw : 0;
+            els.grid.classList.toggle("grid-positive", gridNum > 0.05);   // Bezug
+            els.grid.classList.toggle("grid-negative", gridNum < -0.05);  // Einspeisung
         }
 
         // Phase & current (live)
-        const phaseElem = document.getElementById("phase");
-        const currentElem = document.getElementById("current");
-        phaseElem.textContent = (data.phase === null || data.phase === undefined) ? "–" : data.phase;
-        currentElem.textContent = (data.current === null || data.current === undefined) ? "–" : data.current;
+        setText(els.phase, (data.phase === null || data.phase === undefined) ? "–" : data.phase);
+        setText(els.current, (data.current === null || data.current === undefined) ? "–" : data.current);
     }
 
+    // Hängt ein Request fest (z.B. WLAN-Aussetzer), wird er beim
+    // nächsten Abruf abgebrochen statt sich mit ihm zu stapeln.
+    let currentAbort = null;
+
     async function fetchStatus() {
+        // Liefert den rohen Antwort-Text zurück, damit das adaptive
+        // Polling unveränderte Antworten per String-Vergleich erkennt
+        // (null bei Fehler).
+        if (currentAbort) {
+            currentAbort.abort();
+        }
+        const ac = new AbortController();
+        currentAbort = ac;
         try {
-            const response = await fetch("/api/status");
+            const response = await fetch("/api/status", { signal: ac.signal });
             if (!response.ok) {
                 throw new Error("HTTP " + response.status);
             }
-            const data = await response.json();
-            updateDashboard(data);
+            const text = await response.text();
+            updateDashboard(JSON.parse(text));
+            return text;
         } catch (err) {
-            console.error("Fehler beim Abrufen des Status:", err);
+            if (err.name !== "AbortError") {
+                console.error("Fehler beim Abrufen des Status:", err);
+            }
+            return null;
+        } finally {
+            if (currentAbort === ac) {
+                currentAbort = null;
+            }
         }
     }
 
@@ -1340,19 +1812,122 @@ HTML_PAGE = """
     }
 
 
-    // Initial fetch and periodic polling
+    // Adaptives Polling (Fallback ohne SSE): unveränderte Antworten
+    // verdoppeln das Intervall bis 30 s, jede Änderung setzt es auf 2 s
+    // zurück. Nachts bzw. ohne Ladung sinkt die Request-Rate so um den
+    // Faktor 5-10, ohne die Reaktionszeit bei Aktivität zu opfern.
+    // Basis-Intervall per ?refresh=<sek> übersteuerbar (z.B. für das
+    // Kiosk-Display); der nächste Poll wird erst nach Abschluss des
+    // vorherigen geplant — langsame Antworten stapeln sich also nicht.
+    const basePollInterval =
+        (parseInt(new URLSearchParams(location.search).get("refresh"), 10) * 1000)
+        || 2000;
+    let pollInterval = basePollInterval;
+    let lastPayload = "";
+    let pollingActive = false;   // Fallback-Polling eingeschaltet
+    let pollScheduled = false;   // Poll-Kette läuft gerade (Timeout geplant)
+
+    async function pollOnce() {
+        if (document.hidden) {
+            // Versteckter Tab: niemand sieht die Updates. Kette hier
+            // beenden; visibilitychange startet sie wieder.
+            pollScheduled = false;
+            return;
+        }
+        const payload = await fetchStatus();
+        if (payload !== null) {
+            if (payload === lastPayload) {
+                pollInterval = Math.min(pollInterval * 2, 30000);
+            } else {
+                pollInterval = basePollInterval;
+                lastPayload = payload;
+            }
+        }
+        setTimeout(pollOnce, pollInterval);
+    }
+
+    function startPolling() {
+        if (pollingActive) {
+            return;
+        }
+        pollingActive = true;
+        pollScheduled = true;
+        pollOnce();
+    }
+
+    // Tab-Sichtbarkeit: im Hintergrund laufende Requests abbrechen und
+    // das Polling ruhen lassen; beim Zurückkehren sofort frische Daten
+    // mit zurückgesetztem Intervall.
+    document.addEventListener("visibilitychange", () => {
+        if (document.hidden) {
+            if (currentAbort) {
+                currentAbort.abort();
+            }
+            return;
+        }
+        pollInterval = basePollInterval;
+        if (pollingActive && !pollScheduled) {
+            pollScheduled = true;
+            pollOnce();
+        } else {
+            // SSE-Pfad: einmalig auffrischen, der Stream pusht ohnehin
+            // nur bei Änderungen
+            fetchStatus();
+        }
+    });
+
+    // Push statt Polling: der SSE-Stream liefert nur dann ein Update,
+    // wenn sich der Status tatsächlich geändert hat. Fallback auf
+    // adaptives Polling, falls EventSource fehlt oder endgültig abreißt.
     fetchStatus();
-    setInterval(fetchStatus, 2000);
+    if (window.EventSource) {
+        const es = new EventSource("/api/stream");
+        es.onmessage = (e) => updateDashboard(JSON.parse(e.data));
+        es.onerror = () => {
+            // Transiente Abbrüche (readyState CONNECTING) verbindet der
+            // Browser selbst neu (Server schickt den retry-Hint); nur bei
+            // endgültig geschlossenem Stream auf Polling umschalten.
+            if (es.readyState === EventSource.CLOSED) {
+                startPolling();
+            }
+        };
+    } else {
+        startPolling();
+    }
 </script>
 </body>
 </html>
 """
 
+# Die Seite ist vollständig statisch: einmal beim Import kodieren,
+# komprimieren und mit ETag versehen. Reloads kosten dann nur noch ein
+# 304, die Erstauslieferung rund ein Viertel der Bytes. Level 9, weil
+# nur einmalig beim Import komprimiert wird — die CPU-Zeit fällt nie
+# pro Request an.
+HTML_BYTES = HTML_PAGE.encode("utf-8")
+HTML_GZ = gzip.compress(HTML_BYTES, compresslevel=9)
+HTML_ETAG = hashlib.blake2b(HTML_BYTES, digest_size=8).hexdigest()
 
 
 @app.route("/", methods=["GET"])
 def index():
-    return Response(HTML_PAGE, mimetype="text/html")
+    # send_file über ein BytesIO (pro Request, damit die Leseposition bei
+    # 0 steht): Werkzeug nimmt dann seinen wrap_file-Pfad — hinter einem
+    # passenden WSGI-Server os.sendfile, also Zero-Copy Richtung Socket —
+    # und übernimmt die If-None-Match/304-Behandlung selbst.
+    use_gzip = "gzip" in request.headers.get("Accept-Encoding", "")
+    buf = HTML_GZ if use_gzip else HTML_BYTES
+
+    resp = send_file(
+        io.BytesIO(buf),
+        mimetype="text/html",
+        etag=HTML_ETAG,
+        max_age=300,
+        conditional=True,
+    )
+    if use_gzip:
+        resp.headers["Content-Encoding"] = "gzip"
+    return resp
 
 
 # ---------------------------------------------------------------------------
@@ -1360,13 +1935,45 @@ def index():
 # ---------------------------------------------------------------------------
 
 def start_background_loop():
+    # Bewusst Threads statt asyncio/uvloop: die Loops verbringen ihre
+    # Zeit in blockierendem Netzwerk-I/O (Modbus/HTTP), bei dem CPython
+    # den GIL freigibt — echte GIL-Konkurrenz mit den Flask-Workern
+    # entsteht dadurch praktisch nicht. Der asyncio-Einstieg des
+    # Projekts lebt in oop_project/main.py (dort inkl. uvloop-Guard).
+    # Die Parallelität, die ein gemeinsamer Reactor brächte, liefert
+    # bereits der ThreadPoolExecutor-Fan-out im Snapshot-Pfad; ein
+    # run_loop_async hieße dagegen, requests (go-e) und renault_api
+    # gemischt sync/async zu betreiben und Flask hinter einem
+    # ASGI-Adapter — mehr bewegliche Teile für denselben Durchsatz.
     t = threading.Thread(target=app_state.run_loop, daemon=True)
-    print("[Debug] Starting AppState.run_loop thread...")
+    log.debug("Starting AppState.run_loop thread...")
     t.start()
 
+    # Fahrzeugstatus separat pollen, damit der langsame Cloud-Call den
+    # 1-Hz-Snapshot-Loop nie blockiert
+    t_car = threading.Thread(target=app_state.run_car_status_loop, daemon=True)
+    log.debug("Starting AppState.run_car_status_loop thread...")
+    t_car.start()
+
 
 start_background_loop()
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8080, debug=False)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    # Werkzeugs Dev-Server ist single-threaded: mehrere Dashboard-Clients
+    # serialisieren sich gegenseitig auf /api/status. waitress bedient die
+    # I/O-lastigen Polls mit einem Thread-Pool und HTTP-Keep-Alive; ein
+    # einzelner Prozess, damit der AppState-Singleton erhalten bleibt.
+    # (Gleichwertig: gunicorn -k gthread --workers 1 --threads 8
+    #  --keep-alive 30 -b 0.0.0.0:8080 smart_home.backend_app:app)
+    try:
+        from waitress import serve
+        serve(app, host="0.0.0.0", port=8080, threads=8)
+    except ImportError:
+        log.warning("waitress not installed – falling back to Flask dev server.")
+        app.run(host="0.0.0.0", port=8080, debug=False, threaded=True)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import asyncio
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -34,6 +35,11 @@ class CarClient:
     The client uses a blocking wrapper around an async API call. It is designed
     to be called infrequently (e.g. every few minutes) because the request may
     take several seconds and the remote service is not always reliable.
+
+    Login and vehicle discovery happen once per session and are cached on a
+    private event loop; after the first call, read_status() costs a single
+    battery-status request. An expired session triggers one automatic
+    re-login.
     """
 
     def __init__(
@@ -55,47 +61,82 @@ class CarClient:
                 "set MYRENAULT_EMAIL / MYRENAULT_PASSWORD or pass email/password."
             )
 
-    async def _fetch_status_async(self) -> CarStatus:
-        """Internal async implementation talking to Renault API."""
+        # Persistent state: a private event loop keeps the aiohttp
+        # session (and with it the login token and the discovered
+        # vehicle handle) alive across read_status() calls. Only the
+        # first call pays login + account/vehicle discovery; subsequent
+        # calls are a single get_battery_status round-trip.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._websession: Optional[aiohttp.ClientSession] = None
+        self._vehicle = None
+
+        # read_status may be called from the car-status thread and from
+        # a background refresh worker; the private loop must only ever
+        # run from one thread at a time.
+        self._sync_lock = threading.Lock()
+
+    async def _get_vehicle(self):
+        """
+        Log in and discover the vehicle once; return the cached handle
+        on subsequent calls.
+        """
+        if self._vehicle is not None:
+            return self._vehicle
+
         timeout = aiohttp.ClientTimeout(total=self.timeout_sec)
+        self._websession = aiohttp.ClientSession(timeout=timeout)
 
-        async with aiohttp.ClientSession(timeout=timeout) as websession:
-            client = RenaultClient(websession=websession, locale=self.locale)
-            await client.session.login(self.email, self.password)
+        client = RenaultClient(websession=self._websession, locale=self.locale)
+        await client.session.login(self.email, self.password)
 
-            person = await client.get_person()
-            kamereon_account = next(
-                acc for acc in person.accounts if acc.accountType == "MYRENAULT"
-            )
-            account = await client.get_api_account(kamereon_account.accountId)
-
-            vehicles = await account.get_vehicles()
-            vin = vehicles.vehicleLinks[0].vin
-
-            vehicle = await account.get_api_vehicle(vin)
-            battery = await vehicle.get_battery_status()
-
-            # Renault liefert z.B. "2025-12-01T22:02:51Z"
-            ts_raw = getattr(battery, "timestamp", None)
-
-            if isinstance(ts_raw, str):
-                # ISO-String mit 'Z' → in gültiges ISO-Format konvertieren
-                try:
-                    ts = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
-                except Exception:
-                    ts = None
-            elif isinstance(ts_raw, datetime):
-                ts = ts_raw
-            else:
-                ts = None   # kein Timestamp → None
-
-            return CarStatus(
-                soc=battery.batteryLevel,
-                autonomy_km=battery.batteryAutonomy,
-                plug_status=battery.plugStatus,
-                charging_status=battery.chargingStatus,
-                timestamp=ts,    # None oder echter Messzeitpunkt
-            )
+        person = await client.get_person()
+        kamereon_account = next(
+            acc for acc in person.accounts if acc.accountType == "MYRENAULT"
+        )
+        account = await client.get_api_account(kamereon_account.accountId)
+
+        vehicles = await account.get_vehicles()
+        vin = vehicles.vehicleLinks[0].vin
+
+        self._vehicle = await account.get_api_vehicle(vin)
+        return self._vehicle
+
+    async def _fetch_status_async(self) -> CarStatus:
+        """Internal async implementation talking to Renault API."""
+        vehicle = await self._get_vehicle()
+        battery = await vehicle.get_battery_status()
+
+        # Renault liefert z.B. "2025-12-01T22:02:51Z"
+        ts_raw = getattr(battery, "timestamp", None)
+
+        if isinstance(ts_raw, str):
+            # ISO-String mit 'Z' → in gültiges ISO-Format konvertieren
+            try:
+                ts = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
+            except Exception:
+                ts = None
+        elif isinstance(ts_raw, datetime):
+            ts = ts_raw
+        else:
+            ts = None   # kein Timestamp → None
+
+        return CarStatus(
+            soc=battery.batteryLevel,
+            autonomy_km=battery.batteryAutonomy,
+            plug_status=battery.plugStatus,
+            charging_status=battery.chargingStatus,
+            timestamp=ts,    # None oder echter Messzeitpunkt
+        )
+
+    def _drop_cached_state(self) -> None:
+        """Close the session and forget the cached vehicle handle."""
+        if self._websession is not None:
+            try:
+                self._loop.run_until_complete(self._websession.close())
+            except Exception:
+                pass
+        self._websession = None
+        self._vehicle = None
 
     def read_status(self) -> CarStatus:
         """
@@ -106,8 +147,35 @@ class CarClient:
 
         Raises:
             CarClientError on any error (network, auth, API issues, etc.).
+
+        On an error with a cached session (typically an expired token)
+        the cached state is dropped and one fresh login is attempted
+        before giving up.
+
+        Tests (or offline tooling) can set ``_sync_status_override`` to
+        a CarStatus or a callable returning one; read_status then
+        returns it directly without touching the event loop.
         """
-        try:
-            return asyncio.run(self._fetch_status_async())
-        except Exception as e:
-            raise CarClientError(f"Failed to fetch car status: {e}") from e
+        override = getattr(self, "_sync_status_override", None)
+        if override is not None:
+            return override() if callable(override) else override
+
+        with self._sync_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+
+            had_cached_vehicle = self._vehicle is not None
+            try:
+                return self._loop.run_until_complete(self._fetch_status_async())
+            except Exception as e:
+                self._drop_cached_state()
+                if not had_cached_vehicle:
+                    raise CarClientError(f"Failed to fetch car status: {e}") from e
+
+            # Cached token/session was probably stale – retry once with
+            # a fresh login.
+            try:
+                return self._loop.run_until_complete(self._fetch_status_async())
+            except Exception as e:
+                self._drop_cached_state()
+                raise CarClientError(f"Failed to fetch car status: {e}") from e
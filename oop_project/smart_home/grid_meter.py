@@ -1,6 +1,16 @@
 import requests
 from typing import Optional
 
+# orjson parst die Tasmota-Antworten 2-5x schneller als die stdlib und
+# schlägt bei kaputtem JSON früher fehl; Fallback auf json, falls nicht
+# installiert.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 
 class GridMeterError(Exception):
     """Fehler beim Auslesen des Stromzählers / Tasmota."""
@@ -10,13 +20,15 @@ class GridMeterError(Exception):
 class GridMeter:
     """
     Kapselt den Zugriff auf den optischen Lesekopf (Tasmota).
-    
+
     Parameter:
         ip: IPv4-Adresse des Lesekopfes
         timeout: HTTP-Timeout in Sekunden
+        session: optionale aiohttp.ClientSession für die async-Lesepfade;
+                 wird geteilt und vom Aufrufer geschlossen.
     """
 
-    def __init__(self, ip: str, timeout: float = 3.0):
+    def __init__(self, ip: str, timeout: float = 3.0, session=None):
         self.ip = ip
         self.timeout = timeout
         self.base_url = f"http://{ip}/cm"
@@ -24,6 +36,9 @@ class GridMeter:
         # optional: spätere Optimierung
         self.session = requests.Session()
 
+        # aiohttp.ClientSession (injiziert), nur für read_*_async nötig
+        self._async_session = session
+
 
     # ------------------------------------------------------------
     #  Hilfsfunktion: komplettes JSON holen
@@ -40,13 +55,37 @@ class GridMeter:
                 timeout=self.timeout
             )
             r.raise_for_status()
-            data = r.json()
+            data = _json_loads(r.content)
             return data
 
         except Exception as e:
             raise GridMeterError(f"Fehler beim Auslesen des GridMeters: {e}") from e
 
 
+    # ------------------------------------------------------------
+    #  Hilfsfunktion: Power_cur aus dem JSON ziehen
+    # ------------------------------------------------------------
+    @staticmethod
+    def _extract_power_kw(data: dict) -> float:
+        """
+        Zieht Power_cur (W) aus dem Tasmota-JSON und rechnet in kW um.
+
+        Bewusst über eine .get()-Kette statt KeyError: bei Fehlern wird
+        nur eine kompakte Meldung erzeugt — das komplette JSON-Blob zu
+        stringifizieren wäre bei Fehler-Stürmen unnötig teuer.
+        """
+        power_w = ((data.get("StatusSNS") or {}).get("MT631") or {}).get("Power_cur")
+
+        if power_w is None:
+            raise GridMeterError("Ungültiges JSON: Power_cur fehlt")
+
+        if not isinstance(power_w, (int, float)):
+            raise GridMeterError(f"Power_cur hat ungültigen Typ: {type(power_w).__name__}")
+
+        # Umrechnung Watt → kW
+        return power_w / 1000.0
+
+
     # ------------------------------------------------------------
     #  Hauptfunktion: aktuelle Netzleistung (kW)
     # ------------------------------------------------------------
@@ -60,17 +99,37 @@ class GridMeter:
         Wirft GridMeterError bei Problemen.
         """
         data = self.read_raw()
+        return self._extract_power_kw(data)
 
-        try:
-            power_w = data["StatusSNS"]["MT631"]["Power_cur"]
-        except KeyError as e:
+
+    # ------------------------------------------------------------
+    #  Async-Varianten (geteilte aiohttp-Session, nicht blockierend)
+    # ------------------------------------------------------------
+    async def read_raw_async(self) -> dict:
+        """
+        Wie read_raw(), aber über die injizierte aiohttp-Session.
+        Wirft GridMeterError bei HTTP-/Parsingfehlern oder fehlender Session.
+        """
+        if self._async_session is None:
             raise GridMeterError(
-                f"Ungültiges JSON: Power_cur fehlt ({e}) — raw: {data}"
-            ) from e
+                "Keine aiohttp-Session gesetzt – GridMeter(ip, session=...) verwenden."
+            )
 
-        # Plausibilitätscheck (optional)
-        if not isinstance(power_w, (int, float)):
-            raise GridMeterError(f"Power_cur hat ungültigen Typ: {power_w}")
+        try:
+            async with self._async_session.get(
+                self.base_url,
+                params={"cmnd": "status 10"},
+            ) as r:
+                r.raise_for_status()
+                return _json_loads(await r.read())
 
-        # Umrechnung Watt → kW
-        return power_w / 1000.0
+        except Exception as e:
+            raise GridMeterError(f"Fehler beim Auslesen des GridMeters: {e}") from e
+
+    async def read_power_kw_async(self) -> float:
+        """
+        Async-Variante von read_power_kw() (gleiche Vorzeichenkonvention).
+        Wirft GridMeterError bei Problemen.
+        """
+        data = await self.read_raw_async()
+        return self._extract_power_kw(data)
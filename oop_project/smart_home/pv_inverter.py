@@ -1,7 +1,48 @@
+import asyncio
+import socket
 import struct
+import time
 from typing import Optional
 
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient, ModbusTcpClient
+
+from .ttl_cache import ttl_cache
+
+
+def _tune_modbus_socket(sock) -> None:
+    """
+    Tune a connected Modbus TCP socket for low-latency polling.
+
+    - TCP_NODELAY disables Nagle's algorithm; without it many devices show
+      40-200 ms artificial delay per request/response pair (recommended by
+      the Modbus messaging spec, section 4.3.2).
+    - SO_KEEPALIVE (with a short idle time where available) keeps the
+      connection warm across the polling cadence.
+
+    This is deliberately where the syscall-level tuning stops: at one
+    small Modbus request every couple of seconds, the per-read syscall
+    cost is noise next to the device round-trip, so io_uring-style
+    batched submission would add a platform-specific dependency for no
+    measurable win.
+    """
+    if sock is None:
+        return
+
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+    except OSError:
+        # Socket tuning is best effort; reads still work without it.
+        pass
+
+
+# Short pause before the second read attempt: gives the device a moment
+# to clean up a half-torn-down connection instead of running straight
+# into the same error again. Reads are side-effect free, so repeating
+# them is safe.
+RETRY_DELAY_SEC = 0.2
 
 
 class PVInverterError(Exception):
@@ -13,6 +54,11 @@ class PVInverter:
     """
     Encapsulates Modbus access to the PV inverter (e.g. Kostal).
 
+    Connections are long-lived: clients are created once, connected
+    lazily on first use and reconnected transparently after errors, so a
+    poll costs one Modbus round-trip rather than a TCP handshake plus
+    Modbus setup per read.
+
     Parameters
     ----------
     ip : str
@@ -31,68 +77,228 @@ class PVInverter:
         self.unit_id = unit_id
         self.timeout = timeout
 
+        # Persistent Modbus clients (one per read path), connected lazily.
+        # Keeping the socket open saves a TCP handshake per poll.
+        self._client: Optional[ModbusTcpClient] = None
+        self._async_client: Optional[AsyncModbusTcpClient] = None
+
+    # ------------------------------------------------------------------
+    #  Connection handling (persistent, reconnect on error)
+    # ------------------------------------------------------------------
+    def _get_client(self) -> ModbusTcpClient:
+        """Return the persistent sync client, connecting if needed."""
+        if self._client is None:
+            self._client = ModbusTcpClient(self.ip, port=self.port, timeout=self.timeout)
+
+        if not self._client.connected:
+            self._client.connect()
+            _tune_modbus_socket(getattr(self._client, "socket", None))
+
+        return self._client
+
+    def _drop_client(self) -> None:
+        """Close and forget the sync client (next read reconnects)."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
+    async def _get_async_client(self) -> AsyncModbusTcpClient:
+        """Return the persistent async client, connecting if needed."""
+        if self._async_client is None:
+            self._async_client = AsyncModbusTcpClient(
+                self.ip, port=self.port, timeout=self.timeout
+            )
+
+        if not self._async_client.connected:
+            await self._async_client.connect()
+
+            # Async pymodbus hides the socket behind the asyncio transport
+            transport = getattr(self._async_client, "transport", None)
+            if transport is not None:
+                _tune_modbus_socket(transport.get_extra_info("socket"))
+
+        return self._async_client
+
+    def _drop_async_client(self) -> None:
+        """Close and forget the async client (next read reconnects)."""
+        if self._async_client is not None:
+            try:
+                self._async_client.close()
+            except Exception:
+                pass
+            self._async_client = None
+
+    def close(self) -> None:
+        """Close any open Modbus connections (call on shutdown)."""
+        self._drop_client()
+        self._drop_async_client()
+
     def _read_registers(self, address: int, count: int) -> list[int]:
         """
-        Low-level helper to read holding registers.
+        Low-level helper to read holding registers over the persistent
+        connection. On a communication error the connection is dropped and
+        the read retried once on a fresh socket.
         Raises PVInverterError on any communication problem.
         """
-        client = ModbusTcpClient(self.ip, port=self.port, timeout=self.timeout)
-        client.connect()
+        last_exc: Exception | None = None
+
+        for attempt in range(2):
+            try:
+                client = self._get_client()
+                rr = client.read_holding_registers(
+                    address, count=count, device_id=self.unit_id
+                )
+            except Exception as e:
+                last_exc = e
+                self._drop_client()
+                if attempt == 0:
+                    time.sleep(RETRY_DELAY_SEC)
+                continue
+
+            if rr.isError():
+                raise PVInverterError(f"Modbus error reading address {address}: {rr}")
 
-        try:
-            rr = client.read_holding_registers(address, count=count, device_id=self.unit_id)
-        finally:
-            client.close()
+            return rr.registers
 
-        if rr.isError():
-            raise PVInverterError(f"Modbus error reading address {address}: {rr}")
+        raise PVInverterError(
+            f"Modbus error reading address {address}: {last_exc}"
+        ) from last_exc
+
+    async def _read_registers_async(self, address: int, count: int) -> list[int]:
+        """
+        Async counterpart of :meth:`_read_registers` using pymodbus'
+        AsyncModbusTcpClient, so reads can run concurrently with other
+        device I/O in an asyncio loop. Uses the same persistent-connection
+        scheme with a single retry on a fresh socket.
+        """
+        last_exc: Exception | None = None
 
-        return rr.registers
+        for attempt in range(2):
+            try:
+                client = await self._get_async_client()
+                rr = await client.read_holding_registers(
+                    address, count=count, device_id=self.unit_id
+                )
+            except Exception as e:
+                last_exc = e
+                self._drop_async_client()
+                if attempt == 0:
+                    await asyncio.sleep(RETRY_DELAY_SEC)
+                continue
 
+            if rr.isError():
+                raise PVInverterError(f"Modbus error reading address {address}: {rr}")
+
+            return rr.registers
+
+        raise PVInverterError(
+            f"Modbus error reading address {address}: {last_exc}"
+        ) from last_exc
+
+    @ttl_cache(seconds=2.0)
+    async def read_total_power_kw_async(self) -> float:
+        """
+        Async variant of :meth:`read_total_power_kw` (same register layout
+        and decoding).
+        """
+        regs = await self._read_registers_async(address=172, count=2)
+        return self._decode_float32(regs) / 1000.0
+
+    # ------------------------------------------------------------------
+    #  Register decoding
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _decode_float32(regs: list[int], offset: int = 0) -> float:
+        """
+        Decode a Kostal 32-bit float from two registers at ``offset``.
+
+        wordorder = LITTLE, byteorder = BIG:
+        swap word order, keep big-endian within each word (same layout the
+        old BinaryPayloadDecoder-based code used).
+        """
+        raw_bytes = struct.pack('>HH', regs[offset + 1], regs[offset])
+        return struct.unpack('>f', raw_bytes)[0]
+
+    @staticmethod
+    def _decode_float32_many(regs: list[int], offsets: tuple[int, ...]) -> tuple[float, ...]:
+        """
+        Decode several Kostal 32-bit floats from ``regs`` in one shot.
+
+        All word pairs are packed into a single buffer and unpacked with
+        one ``struct`` call per direction (the struct module caches the
+        compiled formats), instead of one pack/unpack round and two
+        temporary ``bytes`` objects per value.
+        """
+        words: list[int] = []
+        for off in offsets:
+            words += (regs[off + 1], regs[off])
+
+        n = len(offsets)
+        return struct.unpack(f'>{n}f', struct.pack(f'>{2 * n}H', *words))
+
+    @ttl_cache(seconds=2.0)
     def read_total_power_kw(self) -> float:
         """
         Read total AC power from inverter in kW.
 
         The Kostal register layout:
         - 'Total power' at register 172, 2 registers, 32-bit float
-        - old code used BinaryPayloadDecoder with byteorder=BIG, wordorder=LITTLE
-        - here we reproduce that using struct.
         """
         regs = self._read_registers(address=172, count=2)
+        return self._decode_float32(regs) / 1000.0
 
-        # wordorder = LITTLE, byteorder = BIG:
-        # swap word order, keep big-endian within each word
-        raw_bytes = struct.pack('>HH', regs[1], regs[0])
-        value_kw = struct.unpack('>f', raw_bytes)[0] / 1000.0
+    def read_power_snapshot(self) -> dict[str, float]:
+        """Read total AC power and the three DC string powers in one go.
 
-        return value_kw
+        Total power (register 172) and the string powers (registers 260,
+        270, 280) sit within one 110-register span, which is below the
+        Modbus limit of 125 registers per request. Reading the whole span
+        at once costs a single round-trip instead of two, which matters at
+        the 1 Hz snapshot cadence. Callers that need only one of the two
+        groups should keep using :meth:`read_total_power_kw` or
+        :meth:`read_string_powers_kw`.
+
+        Returns
+        -------
+        dict[str, float]
+            Dictionary with keys ``total_kw``, ``pv1_kw``, ``pv2_kw`` and
+            ``pv3_kw``, all in kW.
+        """
+        # Span 172..281: total at offset 0, DC1/DC2/DC3 at offsets
+        # 88/98/108 (= 260/270/280 - 172), all 32-bit floats in Watt.
+        regs = self._read_registers(address=172, count=110)
+        total, pv1, pv2, pv3 = self._decode_float32_many(regs, (0, 88, 98, 108))
+
+        return {
+            "total_kw": total / 1000.0,
+            "pv1_kw": pv1 / 1000.0,
+            "pv2_kw": pv2 / 1000.0,
+            "pv3_kw": pv3 / 1000.0,
+        }
 
     def read_string_powers_kw(self) -> dict[str, float]:
         """Read DC string powers (three inputs) from inverter in kW.
 
+        The three string powers sit at registers 260, 270 and 280, so one
+        pooled read of the 260..281 span costs a single Modbus round-trip
+        instead of three.
+
         Returns
         -------
         dict[str, float]
             Dictionary with keys ``pv1_kw``, ``pv2_kw`` and ``pv3_kw`` giving
             the instantaneous power of the three DC inputs in kW.
         """
-        # Registers for DC1, DC2, DC3 power in Watt.
-        # Each value is encoded as a 32-bit float over 2 registers, using the
-        # same byte/word order as in :meth:`read_total_power_kw`.
-        addresses = (260, 270, 280)
-        powers_kw: list[float] = []
-
-        for addr in addresses:
-            regs = self._read_registers(address=addr, count=2)
-
-            # wordorder = LITTLE, byteorder = BIG:
-            # swap word order, keep big-endian within each word
-            raw_bytes = struct.pack('>HH', regs[1], regs[0])
-            value_w = struct.unpack('>f', raw_bytes)[0]
-            powers_kw.append(value_w / 1000.0)
+        # DC1/DC2/DC3 power in Watt, each a 32-bit float over 2 registers,
+        # using the same byte/word order as in :meth:`read_total_power_kw`.
+        regs = self._read_registers(address=260, count=22)
+        pv1, pv2, pv3 = self._decode_float32_many(regs, (0, 10, 20))
 
         return {
-            "pv1_kw": powers_kw[0],
-            "pv2_kw": powers_kw[1],
-            "pv3_kw": powers_kw[2],
+            "pv1_kw": pv1 / 1000.0,
+            "pv2_kw": pv2 / 1000.0,
+            "pv3_kw": pv3 / 1000.0,
         }
@@ -0,0 +1,49 @@
+# smart_home/sample_window.py
+
+from collections import deque
+
+
+class SampleWindow:
+    """
+    Fixed-size window over float samples with an O(1) running sum.
+
+    Appending keeps the sum incrementally up to date (subtracting the
+    evicted sample when the window is full), so the mean of the window is
+    O(1) instead of re-summing all samples on every control step.
+
+    A plain ``deque`` ring buffer is used instead of a NumPy array on
+    purpose: the window holds at most a few hundred floats and only ever
+    needs append/evict/mean, so vectorisation would not pay for the extra
+    dependency on the Pi.
+
+    Parameters
+    ----------
+    maxlen : int
+        Maximum number of samples kept in the window.
+    """
+
+    def __init__(self, maxlen: int):
+        self._samples: deque[float] = deque(maxlen=maxlen)
+        self._sum: float = 0.0
+
+    def append(self, value: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        if len(self._samples) == self._samples.maxlen:
+            self._sum -= self._samples[0]
+        self._samples.append(value)
+        self._sum += value
+
+    def clear(self) -> None:
+        """Drop all samples and reset the running sum."""
+        self._samples.clear()
+        self._sum = 0.0
+
+    def mean(self) -> float:
+        """Mean of the current window (raises ZeroDivisionError if empty)."""
+        return self._sum / len(self._samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __bool__(self) -> bool:
+        return bool(self._samples)
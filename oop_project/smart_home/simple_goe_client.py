@@ -13,6 +13,8 @@ class GoEStatus:
     car_state: Optional[str]
     phase_mode: Optional[int]      # 1 or 3
     ampere_allowed: Optional[int]  # current limit in A
+    allow_charging: Optional[bool] = None  # field 'alw' (charging allowed?)
+    power_kw: Optional[float] = None       # total charging power from 'nrg'
 
 
 class SimpleGoEClientError(Exception):
@@ -20,6 +22,13 @@ class SimpleGoEClientError(Exception):
     pass
 
 
+# TTL für den Raw-Status-Cache: innerhalb eines Regelzyklus fragen
+# get_status_min und get_energy_since_connected_wh denselben Status ab —
+# der Cache macht daraus einen einzigen HTTP-Roundtrip. Kurz genug, dass
+# Live-Werte (Leistung, car) nicht sichtbar nachhinken.
+RAW_STATUS_TTL_SEC = 0.5
+
+
 class SimpleGoEClient:
     """
     Minimal HTTP client for go-e Charger using the local HTTP API v2.
@@ -36,6 +45,28 @@ class SimpleGoEClient:
         self.base_url = f"http://{ip}"
         self.timeout = timeout
 
+        # Persistente Session mit Keep-Alive: spart den TCP-Handshake pro
+        # Poll/Set-Request an die Box. Kleiner Pool reicht — es reden nur
+        # der Snapshot-Pfad und der Control-Step mit der Wallbox.
+        # Retries nur auf Connect-Ebene (read=0): dann ist die Anfrage
+        # noch nicht bei der Box angekommen und auch ein /api/set wird
+        # nie versehentlich doppelt ausgeführt.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=requests.adapters.Retry(
+                total=2, connect=2, read=0, backoff_factor=0.3
+            ),
+        )
+        self._session.mount("http://", adapter)
+
+        # Raw-Status-Cache (Wert + monotoner Zeitstempel); Setter
+        # invalidieren ihn, damit nach einem Write sofort frisch
+        # gelesen wird.
+        self._raw_status_cache: Optional[Dict[str, Any]] = None
+        self._raw_status_ts: float = 0.0
+
     # -------------------------
     # Low-level helper methods
     # -------------------------
@@ -44,7 +75,7 @@ class SimpleGoEClient:
         """GET request returning JSON."""
         url = f"{self.base_url}{path}"
         try:
-            resp = requests.get(url, params=params, timeout=self.timeout)
+            resp = self._session.get(url, params=params, timeout=self.timeout)
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
@@ -61,11 +92,14 @@ class SimpleGoEClient:
         """
         url = f"{self.base_url}/api/set"
         try:
-            resp = requests.get(url, params=params, timeout=self.timeout)
+            resp = self._session.get(url, params=params, timeout=self.timeout)
             resp.raise_for_status()
         except Exception as e:
             raise SimpleGoEClientError(f"GET {url} with params {params} failed: {e}") from e
 
+        # Nach einem Write ist der gecachte Status veraltet
+        self._raw_status_cache = None
+
     # -------------------------
     # High-level API
     # -------------------------
@@ -74,9 +108,21 @@ class SimpleGoEClient:
         """
         Return the raw status JSON from the charger.
 
-        Uses /api/status of the HTTP API v2.
+        Uses /api/status of the HTTP API v2. Antworten werden für
+        RAW_STATUS_TTL_SEC gecacht, damit mehrere High-Level-Aufrufe im
+        selben Regelzyklus nur einen HTTP-Roundtrip kosten; Setter
+        invalidieren den Cache.
         """
-        return self._get_json("/api/status")
+        if (
+            self._raw_status_cache is not None
+            and time.monotonic() - self._raw_status_ts < RAW_STATUS_TTL_SEC
+        ):
+            return self._raw_status_cache
+
+        data = self._get_json("/api/status")
+        self._raw_status_cache = data
+        self._raw_status_ts = time.monotonic()
+        return data
 
     def get_status_min(self) -> GoEStatus:
         """
@@ -97,6 +143,9 @@ class SimpleGoEClient:
 
         - ampere_allowed:
             aus Feld "amp" (int)
+
+        - power_kw:
+            aus Feld "nrg", Index 11 (Gesamtleistung in W → kW)
         """
         data = self.get_raw_status()
 
@@ -141,10 +190,35 @@ class SimpleGoEClient:
         except Exception:
             ampere_allowed = None
 
+        # ----- allow_charging (Feld 'alw') -----
+        allow_charging: Optional[bool] = None
+        alw_raw = data.get("alw", None)
+        try:
+            if alw_raw is not None:
+                allow_charging = bool(alw_raw)
+        except Exception:
+            allow_charging = None
+
+        # ----- power_kw (aus 'nrg', Index 11 = Gesamtleistung in W) -----
+        # Die /api/status-Antwort enthält die Ladeleistung bereits; damit
+        # spart sich der Snapshot-Pfad einen separaten Modbus-Read.
+        power_kw: Optional[float] = None
+        nrg_raw = data.get("nrg", None)
+        try:
+            if nrg_raw is not None and len(nrg_raw) > 11:
+                power_kw = float(nrg_raw[11]) / 1000.0
+                # Gleicher Plausibilitätsfilter wie im Modbus-Pfad
+                if power_kw < 0 or power_kw > 11.0:
+                    power_kw = 0.0
+        except Exception:
+            power_kw = None
+
         return GoEStatus(
             car_state=car_state,
             phase_mode=phase_mode,
             ampere_allowed=ampere_allowed,
+            allow_charging=allow_charging,
+            power_kw=power_kw,
         )
 
     def get_energy_since_connected_wh(self) -> Optional[float]:
@@ -210,6 +284,22 @@ class SimpleGoEClient:
 
         self._get_set({"amp": ampere})
 
+    def set_many(self, **params: Any) -> None:
+        """
+        Set several values with one combined /api/set request.
+
+        The go-e HTTP API v2 accepts multiple query parameters per call,
+        e.g. /api/set?psm=2&amp=12&frc=2 — one round-trip to the box
+        instead of one per parameter.
+
+        Example:
+          set_many(psm=2, amp=12, frc=2)
+        """
+        if not params:
+            return
+
+        self._get_set(params)
+
     def set_charging_mode(self, on: bool) -> None:
         """
         Enable or disable charging via API v2 using 'frc':
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+import bisect
 import math
+from dataclasses import dataclass
 from typing import Dict
 
 
@@ -36,9 +37,39 @@ class SurplusController:
         self.p_available_kw
     """
 
+    # Affine power (kW) -> current (A) coefficients (a, b) per phase;
+    # folded into the breakpoint tables built in __init__.
+    _CURRENT_COEFFS = {1: (4.4444, 1.1111), 3: (1.2345, 4.0100)}
+
     def __init__(self, params: ControllerParams | None = None):
         self.params = params if params is not None else ControllerParams()
 
+        # Precomputed power breakpoints for the power -> current mapping,
+        # one table per phase. floor(a*p + b) clipped to
+        # [min_current, max_current] is a step function of p; entry i of
+        # a table is the power at which the clipped current first reaches
+        # min_current + 1 + i. A bisect over the table replaces the
+        # affine evaluation, floor and clipping per step.
+        p = self.params
+        self._current_breakpoints = {
+            phase: [
+                self._first_power_reaching(a, b, k)
+                for k in range(p.min_current + 1, p.max_current + 1)
+            ]
+            for phase, (a, b) in self._CURRENT_COEFFS.items()
+        }
+
+        # Phase decision rules keyed by (is_startup, current phase).
+        # Encoding the hysteresis as a flat table makes every reachable
+        # state explicit and turns the nested branches in
+        # _update_phase_and_current into a single dict lookup.
+        self._phase_rules = {
+            (True, 1): lambda a: 3 if a > p.thres_1to3_start else 1,
+            (True, 3): lambda a: 3 if a > p.thres_1to3_start else 1,
+            (False, 1): lambda a: 3 if a > p.thres_1to3 else 1,
+            (False, 3): lambda a: 1 if a < p.thres_3to1 else 3,
+        }
+
         # Internal state
         self.is_startup: bool = True
         self.phase: int = 1       # 1 or 3
@@ -50,12 +81,32 @@ class SurplusController:
     # ------------------------------------------------------------------
     # helper: map power (kW) + phase -> current (A)
     # ------------------------------------------------------------------
-    def _power_to_current(self, power_kw: float, phase: int) -> float:
-        """Convert desired charging power (kW) to current (A)."""
-        if phase == 1:
-            return 4.4444 * power_kw + 1.1111
-        else:
-            return 1.2345 * power_kw + 4.0100
+    @staticmethod
+    def _first_power_reaching(a: float, b: float, k: int) -> float:
+        """
+        Return the smallest float p with ``a * p + b >= k``.
+
+        ``(k - b) / a`` can land one ulp off due to rounding; walking to
+        the exact boundary keeps the breakpoint table bit-identical to
+        evaluating ``floor(a * p + b)`` directly.
+        """
+        t = (k - b) / a
+        while a * t + b < k:
+            t = math.nextafter(t, math.inf)
+        while a * math.nextafter(t, -math.inf) + b >= k:
+            t = math.nextafter(t, -math.inf)
+        return t
+
+    def _power_to_current(self, power_kw: float, phase: int) -> int:
+        """
+        Map desired charging power (kW) to a charging current (A).
+
+        Equivalent to ``floor(a * power_kw + b)`` clipped to
+        ``[min_current, max_current]``, evaluated as a binary search over
+        the breakpoint table precomputed in ``__init__``.
+        """
+        table = self._current_breakpoints[phase]
+        return self.params.min_current + bisect.bisect_right(table, power_kw)
 
     # ------------------------------------------------------------------
     # helper: core decision logic (phase + current) for given available power
@@ -72,25 +123,13 @@ class SurplusController:
         """
         p = self.params
 
-        # --- Phase selection ---
-        if self.is_startup:
-            if available_kw > p.thres_1to3_start:
-                phase_new = 3
-            else:
-                phase_new = 1
-        else:
-            if self.phase == 1 and available_kw > p.thres_1to3:
-                phase_new = 3
-            elif self.phase == 3 and available_kw < p.thres_3to1:
-                phase_new = 1
-            else:
-                phase_new = self.phase
+        # --- Phase selection (rule table built in __init__) ---
+        phase_new = self._phase_rules[(self.is_startup, self.phase)](available_kw)
 
         # --- Current selection ---
         if ((self.current > 0 and available_kw > p.thres_stopp) or
             (self.current == 0 and available_kw > p.thres_start)):
-            current_new = math.floor(self._power_to_current(available_kw, phase_new))
-            current_new = max(p.min_current, min(current_new, p.max_current))
+            current_new = self._power_to_current(available_kw, phase_new)
         else:
             current_new = 0
 
@@ -138,3 +177,44 @@ class SurplusController:
             "current": self.current,
             "p_available_kw": self.p_available_kw,
         }
+
+    def step_batch(self, grid_kw: list[float], wb_kw: list[float]) -> Dict[str, list]:
+        """
+        Replay a whole time series through the controller.
+
+        Convenience for backtesting parameter sets on historical data.
+        The phase and start/stop hysteresis make each step depend on the
+        previous one, so the replay is inherently sequential; the win
+        over calling :meth:`step` from caller code is one Python call
+        per sample and columnar output.
+
+        Parameters
+        ----------
+        grid_kw, wb_kw : list[float]
+            Grid and wallbox power series of equal length, same
+            conventions as :meth:`step`.
+
+        Returns
+        -------
+        dict with keys ``'phase'``, ``'current'`` and
+        ``'p_available_kw'``, each a list aligned with the input series.
+        """
+        if len(grid_kw) != len(wb_kw):
+            raise ValueError("grid_kw and wb_kw must have the same length")
+
+        phases: list[int] = []
+        currents: list[int] = []
+        available: list[float] = []
+
+        step = self.step
+        for g, w in zip(grid_kw, wb_kw):
+            res = step(g, w)
+            phases.append(res["phase"])
+            currents.append(res["current"])
+            available.append(res["p_available_kw"])
+
+        return {
+            "phase": phases,
+            "current": currents,
+            "p_available_kw": available,
+        }
@@ -0,0 +1,55 @@
+# smart_home/ttl_cache.py
+
+import functools
+import inspect
+import time
+
+
+def ttl_cache(seconds: float):
+    """
+    Memoize a device-read method for a short time-to-live.
+
+    Debug snapshots poll the devices every second, but only slowly changing
+    values drive the controller. Caching the last result per instance for
+    ``seconds`` removes the redundant hardware round-trips in between
+    without changing semantics, as long as the TTL stays below the
+    sampling interval of the consumer.
+
+    - One cache slot per method and instance (stored on the instance).
+    - Exceptions are never cached: a failed read leaves the old entry
+      untouched, so the next call retries the hardware.
+    - Works for plain and ``async def`` methods.
+    """
+
+    def decorator(func):
+        slot = f"_ttl_cache_{func.__name__}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                now = time.monotonic()
+                cached = getattr(self, slot, None)
+                if cached is not None and now < cached[1]:
+                    return cached[0]
+
+                value = await func(self, *args, **kwargs)
+                setattr(self, slot, (value, now + seconds))
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            now = time.monotonic()
+            cached = getattr(self, slot, None)
+            if cached is not None and now < cached[1]:
+                return cached[0]
+
+            value = func(self, *args, **kwargs)
+            setattr(self, slot, (value, now + seconds))
+            return value
+
+        return wrapper
+
+    return decorator
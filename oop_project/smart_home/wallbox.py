@@ -1,6 +1,13 @@
+import time
 from typing import Optional
 
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient, ModbusTcpClient
+
+from .ttl_cache import ttl_cache
+
+# Short pause before the second read attempt (see pv_inverter.py):
+# reads are side-effect free, so repeating them is safe.
+RETRY_DELAY_SEC = 0.2
 
 
 class WallboxError(Exception):
@@ -30,16 +37,91 @@ class Wallbox:
         self.device_id = device_id
         self.timeout = timeout
 
+        # Persistent Modbus client, connected lazily. Keeping the socket
+        # open saves a TCP handshake per poll and avoids piling up
+        # TIME_WAIT sockets on the box.
+        self._client: Optional[ModbusTcpClient] = None
+
+    # ------------------------------------------------------------------
+    #  Connection handling (persistent, reconnect on error)
+    # ------------------------------------------------------------------
+    def _get_client(self) -> ModbusTcpClient:
+        """Return the persistent sync client, connecting if needed."""
+        if self._client is None:
+            self._client = ModbusTcpClient(self.ip, port=self.port, timeout=self.timeout)
+
+        if not self._client.connected:
+            self._client.connect()
+
+        return self._client
+
+    def _drop_client(self) -> None:
+        """Close and forget the sync client (next read reconnects)."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
+    def close(self) -> None:
+        """Close any open Modbus connection (call on shutdown)."""
+        self._drop_client()
+
+    def __enter__(self) -> "Wallbox":
+        """Context-manager entry; connection stays lazy until first read."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the persistent connection when leaving the block."""
+        self.close()
+
     def _read_input_registers(self, address: int, count: int) -> list[int]:
         """
-        Low-level helper to read input registers.
+        Low-level helper to read input registers over the persistent
+        connection. On a communication error the connection is dropped
+        and the read retried once on a fresh socket.
         Raises WallboxError on any communication problem.
         """
-        client = ModbusTcpClient(self.ip, port=self.port, timeout=self.timeout)
-        client.connect()
+        last_exc: Exception | None = None
+
+        for attempt in range(2):
+            try:
+                client = self._get_client()
+                rr = client.read_input_registers(
+                    address, count=count, device_id=self.device_id
+                )
+            except Exception as e:
+                last_exc = e
+                self._drop_client()
+                if attempt == 0:
+                    time.sleep(RETRY_DELAY_SEC)
+                continue
+
+            if rr.isError():
+                raise WallboxError(f"Modbus error reading address {address}: {rr}")
+
+            return rr.registers
+
+        raise WallboxError(
+            f"Modbus error reading address {address}: {last_exc}"
+        ) from last_exc
+
+    async def _read_input_registers_async(self, address: int, count: int) -> list[int]:
+        """
+        Async counterpart of :meth:`_read_input_registers` using pymodbus'
+        AsyncModbusTcpClient, so reads can run concurrently with other
+        device I/O in an asyncio loop.
+        """
+        client = AsyncModbusTcpClient(self.ip, port=self.port, timeout=self.timeout)
 
         try:
-            rr = client.read_input_registers(address, count=count, device_id=self.device_id)
+            await client.connect()
+            rr = await client.read_input_registers(
+                address, count=count, device_id=self.device_id
+            )
+        except Exception as e:
+            raise WallboxError(f"Modbus error reading address {address}: {e}") from e
         finally:
             client.close()
 
@@ -48,44 +130,87 @@ class Wallbox:
 
         return rr.registers
 
-    # ------------------------------------------------------------------
-    #  Current charging power
-    # ------------------------------------------------------------------
-    def read_power_kw(self) -> float:
+    @ttl_cache(seconds=2.0)
+    async def read_power_kw_async(self) -> float:
         """
-        Read total charging power from POWER_TOTAL (wire address 120, 2 registers).
-        Return power in kW.
-
-        Scaling: value in 0.01 W → divide by 100000 to get kW.
-        Unrealistic values (<0 or >11 kW) are treated as 0.0 kW.
+        Async variant of :meth:`read_power_kw` (same register layout,
+        scaling and plausibility filter).
         """
-        regs = self._read_input_registers(address=120, count=2)
+        regs = await self._read_input_registers_async(address=120, count=2)
         raw = (regs[0] << 16) | regs[1]
         wb_kw = raw / 100000.0
 
         # Simple plausibility filter
         if wb_kw < 0 or wb_kw > 11.0:
-            # For your setup, more than ~11 kW is not realistic
             return 0.0
 
         return wb_kw
 
+    # ------------------------------------------------------------------
+    #  Combined snapshot (one Modbus request for state + power)
+    # ------------------------------------------------------------------
+    @ttl_cache(seconds=2.0)
+    def read_snapshot(self) -> tuple[int, float]:
+        """
+        Read CAR_STATE and POWER_TOTAL with a single Modbus request.
+
+        CAR_STATE (wire address 100) and POWER_TOTAL (addresses 120..121)
+        sit within one 22-register span, so one read covers both values
+        and any mix of :meth:`read_car_state_raw` and
+        :meth:`read_power_kw` calls within the cache TTL costs a single
+        round-trip instead of two.
+
+        Returns
+        -------
+        tuple[int, float]
+            ``(car_state_raw, power_kw)`` with the same scaling and
+            plausibility filter as the individual readers.
+        """
+        regs = self._read_input_registers(address=100, count=22)
+
+        car_state = int(regs[0])
+
+        # POWER_TOTAL at offset 20..21: value in 0.01 W → divide by
+        # 100000 to get kW.
+        raw = (regs[20] << 16) | regs[21]
+        wb_kw = raw / 100000.0
+
+        # Simple plausibility filter: more than ~11 kW is not realistic
+        # for this setup.
+        if wb_kw < 0 or wb_kw > 11.0:
+            wb_kw = 0.0
+
+        return car_state, wb_kw
+
+    # ------------------------------------------------------------------
+    #  Current charging power
+    # ------------------------------------------------------------------
+    def read_power_kw(self) -> float:
+        """
+        Return total charging power (POWER_TOTAL) in kW.
+
+        Served from the pooled :meth:`read_snapshot` read, so a state
+        read in the same tick does not cost a second request.
+        Unrealistic values (<0 or >11 kW) are treated as 0.0 kW.
+        """
+        return self.read_snapshot()[1]
+
     # ------------------------------------------------------------------
     #  Car connection state
     # ------------------------------------------------------------------
     def read_car_state_raw(self) -> int:
         """
-        Read CAR_STATE (wire address 100, 1 register).
+        Return the raw CAR_STATE value (wire address 100), served from
+        the pooled :meth:`read_snapshot` read.
 
-        Returns the raw uint16 value:
+        Raw uint16 values:
         0: unknown/defect
         1: station ready, no vehicle
         2: vehicle charging
         3: waiting for vehicle
         4: charging finished, vehicle still connected
         """
-        regs = self._read_input_registers(address=100, count=1)
-        return int(regs[0])
+        return self.read_snapshot()[0]
 
     def is_vehicle_connected(self) -> bool:
         """
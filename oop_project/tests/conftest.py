@@ -0,0 +1,31 @@
+# tests/conftest.py
+
+import threading
+
+import pytest
+
+from smart_home.backend_app import AppState
+
+
+@pytest.fixture
+def make_appstate():
+    """
+    Factory für ein leichtgewichtiges AppState ohne __init__:
+    kein Geräte-Setup, kein Thread-Pool, keine Hintergrund-Clients.
+    Für Tests der reinen Statuslogik (z.B. check_battery_saving_stop)
+    reichen Lock und Status-Dict; Felder lassen sich direkt als
+    Keyword-Argumente vorbelegen.
+    """
+    def _make(**status_fields):
+        app = AppState.__new__(AppState)
+        app.lock = threading.Lock()
+        app.status = {
+            "car_soc": None,
+            "car_soc_est": None,
+            "car_status_valid": False,
+            "car_status_timestamp": None,
+        }
+        app.status.update(status_fields)
+        return app
+
+    return _make
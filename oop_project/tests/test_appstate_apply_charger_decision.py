@@ -4,10 +4,12 @@ from smart_home.backend_app import AppState
 
 
 class DummyStatus:
-    def __init__(self, car_state="Idle", phase_mode=1, ampere_allowed=0):
+    def __init__(self, car_state="Idle", phase_mode=1, ampere_allowed=0,
+                 allow_charging=None):
         self.car_state = car_state
         self.phase_mode = phase_mode
         self.ampere_allowed = ampere_allowed
+        self.allow_charging = allow_charging
 
 
 class DummyCharger:
@@ -21,6 +23,7 @@ class DummyCharger:
         self.mode_calls = []
         self.phase_calls = []
         self.amp_calls = []
+        self.set_many_calls = []
 
     def get_status_min(self):
         return self._status
@@ -34,6 +37,9 @@ class DummyCharger:
     def set_ampere(self, amp: int):
         self.amp_calls.append(amp)
 
+    def set_many(self, **params):
+        self.set_many_calls.append(params)
+
 
 def test_apply_charger_decision_does_not_raise_for_various_states():
     """
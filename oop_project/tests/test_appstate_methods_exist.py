@@ -19,7 +19,12 @@ def test_appstate_has_all_required_methods():
 
     app = AppState()
 
-    for method_name in REQUIRED_METHODS:
-        assert hasattr(app, method_name), f"Missing method: AppState.{method_name}"
-        method = getattr(app, method_name)
-        assert callable(method), f"AppState.{method_name} exists but is not callable"
+    # Eine Mengendifferenz statt einer Assertion pro Methode: ein
+    # Durchlauf, und die Fehlermeldung listet gleich alle fehlenden
+    # bzw. nicht aufrufbaren Methoden auf einmal.
+    missing = {
+        name
+        for name in REQUIRED_METHODS
+        if not callable(getattr(app, name, None))
+    }
+    assert not missing, f"Missing or non-callable AppState methods: {sorted(missing)}"
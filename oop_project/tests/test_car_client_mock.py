@@ -1,45 +1,60 @@
 # tests/test_car_client_mock.py
 
+import threading
 from datetime import datetime
-from typing import Optional
+from unittest.mock import AsyncMock
 
 import pytest
 
 from smart_home.car_client import CarClient, CarClientError, CarStatus
 
 
-class FakeCarClientOK(CarClient):
-    """Fake CarClient that returns a fixed status without real API calls."""
+STATUS_OK = CarStatus(
+    soc=78,
+    autonomy_km=150,
+    plug_status=1,
+    charging_status=0.0,
+    timestamp=datetime(2025, 1, 1, 12, 0, 0),
+)
+
+
+def _bare_client() -> CarClient:
+    """
+    Build a CarClient without running __init__ (no credentials needed),
+    carrying only the state read_status actually uses.
+    """
+    client = CarClient.__new__(CarClient)
+    client._loop = None
+    client._websession = None
+    client._vehicle = None
+    client._sync_lock = threading.Lock()
+    return client
+
+
+@pytest.mark.parametrize(
+    "fetch_mock,expected_error",
+    [
+        (AsyncMock(return_value=STATUS_OK), None),
+        (
+            AsyncMock(side_effect=RuntimeError("Simulated Renault API failure")),
+            CarClientError,
+        ),
+    ],
+    ids=["ok", "error"],
+)
+def test_car_client_read_status(monkeypatch, fetch_mock, expected_error):
+    """
+    read_status should return the mocked CarStatus on success and wrap
+    any failure from the async fetch in CarClientError.
+    """
+    monkeypatch.setattr(CarClient, "_fetch_status_async", fetch_mock)
+    client = _bare_client()
+
+    if expected_error is not None:
+        with pytest.raises(expected_error):
+            client.read_status()
+        return
 
-    def __init__(self) -> None:
-        # Do not call the real __init__ (no credentials needed here)
-        pass
-
-    async def _fetch_status_async(self) -> CarStatus:
-        """Return a fixed CarStatus for testing."""
-        return CarStatus(
-            soc=78,
-            autonomy_km=150,
-            plug_status=1,
-            charging_status=0.0,
-            timestamp=datetime(2025, 1, 1, 12, 0, 0),
-        )
-
-
-class FakeCarClientError(CarClient):
-    """Fake CarClient that always fails in the async method."""
-
-    def __init__(self) -> None:
-        # Do not call the real __init__
-        pass
-
-    async def _fetch_status_async(self) -> CarStatus:
-        raise RuntimeError("Simulated Renault API failure")
-
-
-def test_car_client_read_status_ok():
-    """read_status should return a CarStatus object with expected values."""
-    client = FakeCarClientOK()
     status = client.read_status()
 
     assert isinstance(status, CarStatus)
@@ -47,13 +62,5 @@ def test_car_client_read_status_ok():
     assert status.autonomy_km == 150
     assert status.plug_status == 1
     assert status.charging_status == 0.0
-    # Timestamp should be exactly the one we set in the fake
+    # Timestamp should be exactly the one from the mocked status
     assert status.timestamp == datetime(2025, 1, 1, 12, 0, 0)
-
-
-def test_car_client_read_status_raises_on_error():
-    """read_status should wrap errors in CarClientError."""
-    client = FakeCarClientError()
-
-    with pytest.raises(CarClientError):
-        _ = client.read_status()
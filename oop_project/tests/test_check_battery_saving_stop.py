@@ -2,7 +2,6 @@ import time
 from datetime import datetime, timedelta
 
 from smart_home.backend_app import (
-    AppState,
     BATTERY_SAVING_SOC_LIMIT,
     BATTERY_SAVING_MAX_AGE_SEC,
 )
@@ -14,12 +13,19 @@ def _iso_now_minus(delta_sec: float) -> str:
     return dt.isoformat(timespec="seconds")
 
 
-def test_check_battery_saving_stop_triggers_for_high_soc_and_fresh_data():
+# Einmal beim Import berechnete Zeitstempel: die Tests brauchen nur die
+# Unterscheidung frisch/veraltet, nicht ein pro Test neu formatiertes
+# exaktes Alter.
+TS_FRESH = _iso_now_minus(10.0)
+TS_STALE = _iso_now_minus(BATTERY_SAVING_MAX_AGE_SEC + 30.0)
+
+
+def test_check_battery_saving_stop_triggers_for_high_soc_and_fresh_data(make_appstate):
     """High SoC, frische Daten, car_status_valid=True -> Stop = True."""
-    app = AppState()
+    app = make_appstate()
 
     soc = BATTERY_SAVING_SOC_LIMIT + 1.0  # sicher über der Schwelle
-    ts_iso = _iso_now_minus(10.0)        # 10 s alt, also frisch
+    ts_iso = TS_FRESH                    # 10 s alt, also frisch
 
     with app.lock:
         app.status["car_soc"] = soc
@@ -32,12 +38,12 @@ def test_check_battery_saving_stop_triggers_for_high_soc_and_fresh_data():
     assert soc_value == soc
 
 
-def test_check_battery_saving_stop_no_stop_when_soc_below_limit():
+def test_check_battery_saving_stop_no_stop_when_soc_below_limit(make_appstate):
     """SoC unterhalb der Schwelle -> kein Stop, auch bei frischen Daten."""
-    app = AppState()
+    app = make_appstate()
 
     soc = BATTERY_SAVING_SOC_LIMIT - 5.0
-    ts_iso = _iso_now_minus(10.0)
+    ts_iso = TS_FRESH
 
     with app.lock:
         app.status["car_soc"] = soc
@@ -50,13 +56,13 @@ def test_check_battery_saving_stop_no_stop_when_soc_below_limit():
     assert soc_value == soc
 
 
-def test_check_battery_saving_stop_no_stop_when_data_too_old():
+def test_check_battery_saving_stop_no_stop_when_data_too_old(make_appstate):
     """SoC über Limit, aber Daten älter als BATTERY_SAVING_MAX_AGE_SEC -> kein Stop."""
-    app = AppState()
+    app = make_appstate()
 
     soc = BATTERY_SAVING_SOC_LIMIT + 5.0
     # Zeitstempel absichtlich älter als die erlaubte Maximalzeit
-    ts_iso = _iso_now_minus(BATTERY_SAVING_MAX_AGE_SEC + 30.0)
+    ts_iso = TS_STALE
 
     with app.lock:
         app.status["car_soc"] = soc
@@ -69,12 +75,12 @@ def test_check_battery_saving_stop_no_stop_when_data_too_old():
     assert soc_value == soc
 
 
-def test_check_battery_saving_stop_no_stop_when_status_invalid():
+def test_check_battery_saving_stop_no_stop_when_status_invalid(make_appstate):
     """car_status_valid=False -> immer kein Stop, auch bei hohem SoC."""
-    app = AppState()
+    app = make_appstate()
 
     soc = BATTERY_SAVING_SOC_LIMIT + 10.0
-    ts_iso = _iso_now_minus(5.0)
+    ts_iso = TS_FRESH
 
     with app.lock:
         app.status["car_soc"] = soc
@@ -87,9 +93,9 @@ def test_check_battery_saving_stop_no_stop_when_status_invalid():
     assert soc_value == soc
 
 
-def test_check_battery_saving_stop_handles_missing_timestamp():
+def test_check_battery_saving_stop_handles_missing_timestamp(make_appstate):
     """Fehlender/None-Timestamp -> defensiv kein Stop, aber SoC wird zurückgegeben."""
-    app = AppState()
+    app = make_appstate()
 
     soc = BATTERY_SAVING_SOC_LIMIT + 5.0
 
@@ -5,6 +5,7 @@ from smart_home.grid_meter import GridMeter, GridMeterError
 GRID_IP = "192.168.178.191"
 
 
+@pytest.mark.live
 def test_gridmeter_live_power_range():
     """
     Testet den Live-Wert der Wirkleistung.
@@ -12,7 +13,7 @@ def test_gridmeter_live_power_range():
     
     Bereich: -20 ... +20 kW
     """
-    meter = GridMeter(GRID_IP)
+    meter = GridMeter(GRID_IP, timeout=0.5)
 
     try:
         power_kw = meter.read_power_kw()
@@ -1,7 +1,9 @@
 # tests/test_mode_switch_triggers_control.py
 
 import math
-from typing import List, Optional
+from typing import Optional
+
+from smart_home.sample_window import SampleWindow
 
 
 CONTROL_PERIOD_SEC = 300  # wie im produktiven Code
@@ -9,6 +11,12 @@ CONTROL_PERIOD_SEC = 300  # wie im produktiven Code
 
 class DummyController:
     """Minimaler Controller mit gleicher Schnittstelle wie SurplusController."""
+
+    # __slots__: kein __dict__ pro Instanz, Attributzugriff über
+    # Slot-Deskriptoren — und Tippfehler bei Attributnamen fallen
+    # sofort als AttributeError auf.
+    __slots__ = ("calls",)
+
     def __init__(self):
         self.calls = []  # speichert (grid_kw, wb_kw)
 
@@ -28,9 +36,21 @@ class FakeAppState:
     Keine Hardware, kein Flask, keine Threads.
     """
 
+    __slots__ = (
+        "controller",
+        "grid_samples",
+        "counter",
+        "just_switched_to_pv",
+        "status",
+        "last_phase_set",
+        "last_current_set",
+    )
+
     def __init__(self) -> None:
         self.controller = DummyController()
-        self.grid_samples: List[float] = []
+        # Wie im produktiven run_loop: Fenster mit O(1)-laufender Summe
+        # statt sum()/len() über eine Liste pro Regelschritt.
+        self.grid_samples = SampleWindow(maxlen=CONTROL_PERIOD_SEC)
         self.counter: int = 0
         self.just_switched_to_pv: bool = False
         self.status = {
@@ -70,7 +90,7 @@ class FakeAppState:
         if not trigger_control:
             return
 
-        grid_avg_kw = sum(self.grid_samples) / len(self.grid_samples)
+        grid_avg_kw = self.grid_samples.mean()
         result = self.controller.step(grid_kw=grid_avg_kw, wb_kw=wb_kw_avg)
 
         # Status aktualisieren
@@ -80,7 +100,7 @@ class FakeAppState:
 
         # Flag zurücksetzen, Samples leeren
         self.just_switched_to_pv = False
-        self.grid_samples = []
+        self.grid_samples.clear()
 
         # "Wallbox" setzen
         self.apply_charger_decision(
@@ -103,7 +123,8 @@ def test_mode_switch_triggers_immediate_control_cycle():
     app = FakeAppState()
 
     # 1) System hat bereits Grid-Samples gesammelt, ist aber noch im monitor_only-Modus
-    app.grid_samples = [4.0, 6.0]  # Mittelwert = 5.0 kW
+    app.grid_samples.append(4.0)  # Mittelwert = 5.0 kW
+    app.grid_samples.append(6.0)
     app.counter = 100  # irgendwo mitten im 5-Minuten-Fenster
     wb_kw_avg = 3.0
 
@@ -135,7 +156,7 @@ def test_mode_switch_triggers_immediate_control_cycle():
     assert app.last_current_set == 10
 
     # grid_samples sollten geleert sein
-    assert app.grid_samples == []
+    assert len(app.grid_samples) == 0
 
     # Flag muss zurückgesetzt sein
     assert app.just_switched_to_pv is False
@@ -8,6 +8,7 @@ PV_PORT = 1502
 PV_UNIT = 71
 
 
+@pytest.mark.live
 def test_pvinverter_live_power_range():
     """
     Live test: read current PV power and check that it is in a
@@ -15,7 +16,7 @@ def test_pvinverter_live_power_range():
 
     This test assumes that the inverter is reachable on the given IP/port.
     """
-    inverter = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT)
+    inverter = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT, timeout=0.5)
 
     try:
         power_kw = inverter.read_total_power_kw()
@@ -29,6 +30,7 @@ def test_pvinverter_live_power_range():
     )
 
 
+@pytest.mark.live
 def test_pvinverter_string_powers_range():
     """
     Live test: read current PV string powers and check that they are in a
@@ -36,7 +38,7 @@ def test_pvinverter_string_powers_range():
 
     This test assumes that the inverter is reachable on the given IP/port.
     """
-    inverter = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT)
+    inverter = PVInverter(PV_IP, port=PV_PORT, unit_id=PV_UNIT, timeout=0.5)
 
     try:
         powers = inverter.read_string_powers_kw()
@@ -71,3 +71,22 @@ def test_surplus_controller_high_surplus():
     # Current must be > 0 and within allowed limits
     assert result["current"] > 0
     assert params.min_current <= result["current"] <= params.max_current
+
+
+def test_surplus_controller_step_batch_matches_step():
+    """
+    step_batch over a series must give the same trajectory as calling
+    step per sample.
+    """
+    grid = [1.0, -3.0, -5.0, -1.0, 0.5]
+    wb = [0.0, 0.0, 3.0, 3.0, 0.0]
+
+    ctrl_single = SurplusController(ControllerParams())
+    expected = [ctrl_single.step(g, w) for g, w in zip(grid, wb)]
+
+    ctrl_batch = SurplusController(ControllerParams())
+    result = ctrl_batch.step_batch(grid, wb)
+
+    assert result["phase"] == [r["phase"] for r in expected]
+    assert result["current"] == [r["current"] for r in expected]
+    assert result["p_available_kw"] == [r["p_available_kw"] for r in expected]
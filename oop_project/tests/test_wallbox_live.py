@@ -5,12 +5,13 @@ from smart_home.wallbox import Wallbox, WallboxError
 WALLBOX_IP = "192.168.178.21"
 
 
+@pytest.mark.live
 def test_wallbox_is_vehicle_connected_returns_bool():
     """
     Live test: verify that is_vehicle_connected() returns a boolean.
     The actual value (True/False) does NOT matter.
     """
-    wb = Wallbox(WALLBOX_IP)
+    wb = Wallbox(WALLBOX_IP, timeout=0.5)
 
     try:
         result = wb.is_vehicle_connected()
@@ -1,10 +1,28 @@
 # %% Hauptskript
+import logging
+import socket
+import struct
 import time
-import math
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from goecharger_api_lite import GoeCharger
 from pymodbus.client import ModbusTcpClient
 
+# orjson parst die kleinen Tasmota-Antworten deutlich schneller als die
+# stdlib (wie in oop_project/smart_home/grid_meter.py); Fallback auf
+# json, falls nicht installiert.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Ein Logger fürs ganze Skript; %-Platzhalter statt f-Strings, damit
+# das Formatieren entfällt, wenn der Level (z.B. DEBUG) aus ist.
+logger = logging.getLogger("wallbox")
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -35,6 +53,12 @@ params = {
     "deltaP":           0.0   # kW, safety margin between available PV power and charging power
 }
 
+# Debug output: read/print only every DEBUG_EVERY seconds instead of at
+# 1 Hz, and only print when a value moved by more than DEBUG_EPS_KW.
+# Cuts the Modbus/HTTP debug traffic by an order of magnitude.
+DEBUG_EVERY = 10   # s
+DEBUG_EPS_KW = 0.05
+
 # Internal state
 is_startup = True
 phase = 1        # 1 or 3 phases currently used
@@ -44,9 +68,111 @@ current = 0      # A, currently set charging current
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
-import struct
-from pymodbus.client import ModbusTcpClient
 
+# Vorkompiliertes Float-Format fürs Kostal-Decoding (kein Format-String-
+# Parsing pro read_pv_power_kw-Aufruf).
+_F32 = struct.Struct('>f')
+
+
+# Persistent Modbus clients: eine TCP-Verbindung pro Gerät statt
+# connect()/close() bei jedem Lesevorgang (spart den TCP-Handshake im
+# Sekundentakt). Verbunden wird lazy beim ersten Zugriff; nach einem
+# Fehler wird die Verbindung geschlossen und beim nächsten Aufruf neu
+# aufgebaut.
+_kostal_client = ModbusTcpClient(KOSTAL_IP, port=KOSTAL_PORT, timeout=3)
+_wb_client = ModbusTcpClient(CHARGER_IP, port=502, timeout=3)
+
+# Ein kleiner Thread-Pool, um die unabhängigen Geräte-Reads pro Tick zu
+# überlappen (ein Worker pro Gerät).
+_io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="io")
+
+
+class _CircuitBreaker:
+    """
+    Kleiner Sicherungsautomat pro Endpunkt: nach aufeinanderfolgenden
+    Fehlern werden weitere Versuche für min(60, 2**fail_count) Sekunden
+    übersprungen, danach gibt es genau einen Probe-Versuch; Erfolg setzt
+    zurück. Ein totes Gerät kostet so nicht mehr bei jedem Zugriff den
+    vollen 3-s-Timeout und blockiert den Regeltakt nicht.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.fail_count = 0
+        self.last_fail_ts = 0.0
+
+    def allow(self):
+        """True, wenn ein Versuch erlaubt ist (geschlossen oder Probe fällig)."""
+        if self.fail_count == 0:
+            return True
+        wait = min(60.0, 2.0 ** self.fail_count)
+        return time.monotonic() - self.last_fail_ts >= wait
+
+    def record_failure(self):
+        self.fail_count += 1
+        self.last_fail_ts = time.monotonic()
+
+    def record_success(self):
+        self.fail_count = 0
+
+
+_kostal_breaker = _CircuitBreaker("kostal")
+_meter_breaker = _CircuitBreaker("meter")
+_wb_breaker = _CircuitBreaker("wallbox")
+
+
+def _ensure_connected(client):
+    """Connect the client lazily if its socket is not (or no longer) open."""
+    if not client.connected:
+        client.connect()
+        # Modbus-MBAP-Frames sind winzig und der Ablauf ist strikt
+        # Request/Response: ohne TCP_NODELAY hängt Nagle an jedem Read
+        # bis zu ~40 ms dran. SO_KEEPALIVE hält die persistente
+        # Verbindung über die Polling-Pausen hinweg warm.
+        sock = getattr(client, "socket", None)
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            except OSError:
+                pass  # Tuning ist Best-Effort, Lesen geht auch ohne
+
+
+# Kostal-Register als Block: alle Register, die das Skript braucht, kommen
+# mit EINER Modbus-Transaktion statt einem RPC pro Wert. Heute ist das nur
+# 'Total power' (172/173, 32-bit float); neue Werte erweitern Start/Count
+# und greifen per Offset in den Block, ohne weitere Round-Trips.
+KOSTAL_BLOCK_START = 172
+KOSTAL_BLOCK_COUNT = 2
+
+
+def _read_kostal_block():
+    """
+    Read the configured Kostal register block in one transaction and
+    return the raw 16-bit registers. Raises RuntimeError on any error
+    (the connection is dropped so the next call reconnects) and while
+    the circuit breaker is holding off after repeated failures.
+    """
+    if not _kostal_breaker.allow():
+        raise RuntimeError("Kostal read skipped (backing off after errors)")
+
+    try:
+        _ensure_connected(_kostal_client)
+        rr = _kostal_client.read_holding_registers(
+            KOSTAL_BLOCK_START, count=KOSTAL_BLOCK_COUNT, device_id=KOSTAL_UNIT
+        )
+    except Exception as e:
+        _kostal_client.close()  # nächster Aufruf verbindet neu
+        _kostal_breaker.record_failure()
+        raise RuntimeError(f"Error reading Kostal register block: {e}")
+
+    if rr.isError():
+        _kostal_client.close()
+        _kostal_breaker.record_failure()
+        raise RuntimeError(f"Error reading Kostal register block: {rr}")
+
+    _kostal_breaker.record_success()
+    return rr.registers
 
 
 def read_pv_power_kw():
@@ -54,29 +180,45 @@ def read_pv_power_kw():
     Read 'Total power' from Kostal inverter via Modbus and return kW.
     Equivalent zu deinem alten read_kostal_inverter_data()['Total power'].
 
-    Registeradresse laut altem Skript: 172 (2 Register, 32-bit float).
-    In deinem alten Code:
+    Registeradresse laut altem Skript: 172 (2 Register, 32-bit float),
+    Offset 0 im Registerblock. In deinem alten Code:
       BinaryPayloadDecoder.fromRegisters(..., byteorder=BIG, wordorder=LITTLE)
       -> decode_32bit_float()
     Das wird hier über struct nachgebildet.
     """
-    client = ModbusTcpClient(KOSTAL_IP, port=KOSTAL_PORT, timeout=3)
-    client.connect()
+    regs = _read_kostal_block()
+    off = 172 - KOSTAL_BLOCK_START
 
-    rr = client.read_holding_registers(172, count=2, device_id=KOSTAL_UNIT)
-    if rr.isError():
-        client.close()
-        raise RuntimeError(f"Error reading Kostal Total power: {rr}")
+    # Entspricht byteorder=BIG, wordorder=LITTLE: Wörter vertauscht,
+    # innerhalb des Wortes Big-Endian. Die Register werden per Shift zu
+    # einem uint32 kombiniert und über das vorkompilierte Struct
+    # dekodiert — kein Format-Parsing und ein pack()-Zwischenobjekt
+    # weniger pro Aufruf.
+    raw = (regs[off + 1] << 16) | regs[off]
+    value_kw = _F32.unpack(raw.to_bytes(4, 'big'))[0] / 1000.0  # wie in deinem alten Skript (/1000,1)
 
-    regs = rr.registers  # [reg0, reg1], 16-bit each
+    return value_kw
 
-    # Entspricht byteorder=BIG, wordorder=LITTLE:
-    # Wörter vertauscht, innerhalb des Wortes Big-Endian.
-    raw_bytes = struct.pack('>HH', regs[1], regs[0])
-    value_kw = struct.unpack('>f', raw_bytes)[0] / 1000.0  # wie in deinem alten Skript (/1000,1)
 
-    client.close()
-    return value_kw
+class _TunedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that applies the same socket tuning as the Modbus side."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Eine Session fürs ganze Skript: requests.get() baut sonst für jeden
+# Zähler-Read (alle 10 s fürs Mittel, jede Sekunde fürs Debug) eine neue
+# TCP-Verbindung auf. Tasmota kann Keep-Alive, also spart der Pool den
+# Handshake pro Anfrage.
+_meter_session = requests.Session()
+_meter_session.mount(
+    "http://", _TunedHTTPAdapter(pool_connections=2, pool_maxsize=4)
+)
 
 
 def read_grid_power_kw():
@@ -87,21 +229,30 @@ def read_grid_power_kw():
     Power_cur > 0  -> grid import (Bezug)
     Power_cur < 0  -> grid export (Einspeisung)
     """
+    if not _meter_breaker.allow():
+        raise RuntimeError("Meter read skipped (backing off after errors)")
+
     url = f"http://{METER_IP}/cm?cmnd=Status%2010"
-    r = requests.get(url, timeout=3)
-    data = r.json()
+    try:
+        r = _meter_session.get(url, timeout=3)
+        data = _json_loads(r.content)
+    except Exception:
+        _meter_breaker.record_failure()
+        raise
 
     sns = data.get("StatusSNS", {})
     mt = sns.get("MT631", {})
     p_w = mt.get("Power_cur")  # W
 
     if p_w is None:
+        _meter_breaker.record_failure()
         raise RuntimeError("Power_cur not found in Tasmota response")
 
+    _meter_breaker.record_success()
     return float(p_w) / 1000.0  # kW
 
 
-def read_wb_power_kw(ip):
+def read_wb_power_kw():
     """
     Read go-e POWER_TOTAL via Modbus (Input Register 120, length 2)
     and return current charging power in kW.
@@ -110,30 +261,65 @@ def read_wb_power_kw(ip):
     Unrealistic register spikes (e.g. 42949 kW from 0xFFFFFFFF) are filtered.
     Fallback is always 0.0 kW.
     """
-    client = ModbusTcpClient(ip, port=502, timeout=3)
-    client.connect()
-
-    rr = client.read_input_registers(120, count=2, device_id=1)
+    if not _wb_breaker.allow():
+        return 0.0  # Backoff nach Fehlern, still wie der übrige Fallback
+
+    try:
+        _ensure_connected(_wb_client)
+        rr = _wb_client.read_input_registers(120, count=2, device_id=1)
+    except Exception as e:
+        _wb_client.close()  # nächster Aufruf verbindet neu
+        _wb_breaker.record_failure()
+        logger.warning("Error reading POWER_TOTAL: %s", e)
+        return 0.0
 
     if rr.isError():
-        client.close()
-        print(f"Warning: error reading POWER_TOTAL: {rr}")
+        _wb_client.close()
+        _wb_breaker.record_failure()
+        logger.warning("Error reading POWER_TOTAL: %s", rr)
         return 0.0
 
+    _wb_breaker.record_success()
     regs = rr.registers  # list of two uint16
     raw = (regs[0] << 16) | regs[1]   # combine into uint32
 
-    client.close()
+    # sanity check — ignore nonsense from uninitialized register.
+    # Direkt auf dem uint32 geprüft (11 kW = 1_100_000 raw), damit der
+    # Müllfall gar nicht erst in Float konvertiert wird; negativ kann
+    # der kombinierte Wert nicht werden.
+    if raw > 1_100_000:
+        logger.warning("Ignoring unrealistic WB power value (raw=%s, regs=%s)", raw, regs)
+        return 0.0
 
-    wb_kw = raw / 100000.0  # kW
+    return raw * 1e-5  # kW (Multiplikation statt Division)
 
-    # sanity check — ignore nonsense from uninitialized register
-    if wb_kw < 0 or wb_kw > 11.0:
-        print(f"Warning: ignoring unrealistic WB power value: {wb_kw:.2f} kW "
-              f"(raw={raw}, regs={regs})")
-        return 0.0
 
-    return wb_kw
+def _debug_changed(new_kw, old_kw):
+    """
+    True, wenn sich ein Debug-Wert um mehr als DEBUG_EPS_KW bewegt hat.
+    NaN (Lesefehler) zählt als Änderung, sobald sich der Fehlerzustand
+    gegenüber dem letzten Druck ändert.
+    """
+    new_nan = new_kw != new_kw
+    old_nan = old_kw != old_kw
+    if new_nan or old_nan:
+        return new_nan != old_nan
+    return abs(new_kw - old_kw) > DEBUG_EPS_KW
+
+
+# Lineare kW->A-Abbildung als (Steigung, Achsenabschnitt) je Phasenzahl;
+# ersetzt den if/else-Zweig in power2current.
+_P2C = {
+    1: (4.4444, 1.1111),
+    3: (1.2345, 4.0100),
+}
+
+# Hysterese-Schwellen je aktueller Phasenzahl: von 1 führt nur eine
+# Aufwärts-Kante weg (über thres_1to3), von 3 nur eine Abwärts-Kante
+# (unter thres_3to1). None = keine Kante in diese Richtung. Zwei
+# Lookups und zwei Vergleiche statt der verschachtelten if-Kaskade.
+_UP_THRES = {1: params["thres_1to3"], 3: None}
+_DOWN_THRES = {1: None, 3: params["thres_3to1"]}
 
 
 def power2current(power_kw, phase_local):
@@ -141,11 +327,8 @@ def power2current(power_kw, phase_local):
     Convert desired charging power (kW) and phase count (1 or 3) into a charging current (A).
     Uses the same linear mappings as in the original script.
     """
-    if phase_local == 1:
-        current_local = 4.4444 * power_kw + 1.1111
-    else:
-        current_local = 1.2345 * power_kw + 4.0100
-    return current_local
+    slope, intercept = _P2C[phase_local if phase_local == 1 else 3]
+    return slope * power_kw + intercept
 
 
 def update_phase_and_current(available_power_kw):
@@ -171,9 +354,11 @@ def update_phase_and_current(available_power_kw):
             phase_new = 1
     else:
         # Subsequent runs: hysteresis between 1 and 3 phases
-        if phase == 1 and available_power_kw > params["thres_1to3"]:
+        up = _UP_THRES[phase]
+        down = _DOWN_THRES[phase]
+        if up is not None and available_power_kw > up:
             phase_new = 3
-        elif phase == 3 and available_power_kw < params["thres_3to1"]:
+        elif down is not None and available_power_kw < down:
             phase_new = 1
         else:
             phase_new = phase
@@ -181,7 +366,10 @@ def update_phase_and_current(available_power_kw):
     # --- Current selection -------------------------------------------------
     if ((current > 0 and available_power_kw > params["thres_stopp"]) or
         (current == 0 and available_power_kw > params["thres_start"])):
-        current_new = math.floor(power2current(available_power_kw, phase_new))
+        # int() statt math.floor: available_power_kw ist hier > 0, damit
+        # ist die lineare Abbildung positiv und int() identisch zu floor.
+        slope, intercept = _P2C[phase_new]
+        current_new = int(slope * available_power_kw + intercept)
         current_new = max(params["min_current"], min(current_new, params["max_current"]))
     else:
         current_new = 0
@@ -196,25 +384,83 @@ def update_phase_and_current(available_power_kw):
 def main():
     global is_startup, phase, current
 
+    # INFO zeigt Regel-Entscheidungen und Warnungen; Level auf DEBUG
+    # stellen, um die getakteten Momentanwert-Zeilen zu sehen.
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
     charger = GoeCharger(CHARGER_IP)
     setValues = charger.SettableValueEnum()
 
-    grid_list = []   # last grid power samples (kW)
+    # Ringpuffer statt Liste + Slicing: deque(maxlen=30) wirft alte
+    # Samples selbst raus, und die mitgeführte Summe macht den
+    # 5-Minuten-Mittelwert zu einer einzigen Division statt O(N)-sum().
+    # Bewusst laufende Summe statt Welford-Mittelwert: bei 30 Samples im
+    # einstelligen kW-Bereich ist der Rundungsfehler der Summe irrelevant,
+    # und das Leeren nach jeder Regelentscheidung setzt ihn ohnehin zurück.
+    grid_list = deque(maxlen=30)   # last grid power samples (kW)
+    grid_sum = 0.0                 # running sum over grid_list
     counter = 0      # 0..299, one step per second
+    last_debug = None              # zuletzt gedruckte (pv, grid, wb)-Werte
+
+    # Monotone Deadline statt time.sleep(1) am Stück: so driftet der
+    # Takt nicht mit der I/O-Dauer, geschlafen wird nur der Rest der
+    # Sekunde. Sample- (10 s), Regel- (300 s) und Debug-Raster bleiben
+    # ganzzahlige Vielfache des Ticks und laufen weiter über counter.
+    next_tick = time.monotonic()
 
     while True:
         try:
+            # Pro Tick bestimmen, welche Geräte überhaupt gebraucht
+            # werden, und jedes höchstens EINMAL lesen — das Sample wird
+            # zwischen Mittelung, Regelblock und Debug-Ausgabe geteilt
+            # (vorher wurden Grid und Wallbox auf denselben Ticks doppelt
+            # gelesen). Die nötigen Reads laufen parallel im Pool an, der
+            # Tick dauert max(RTT) statt Summe der Round-Trips.
+            debug_tick = (counter % DEBUG_EVERY == 0
+                          and logger.isEnabledFor(logging.DEBUG))
+            sample_tick = PV_SURPLUS_MODE and counter % 10 == 0
+            decision_tick = PV_SURPLUS_MODE and (counter == 299 or is_startup)
+
+            grid_future = (_io_pool.submit(read_grid_power_kw)
+                           if sample_tick or debug_tick else None)
+            wb_future = (_io_pool.submit(read_wb_power_kw)
+                         if decision_tick or debug_tick else None)
+            pv_future = _io_pool.submit(read_pv_power_kw) if debug_tick else None
+
+            grid_now_kw = None
+            if grid_future is not None:
+                try:
+                    grid_now_kw = grid_future.result()
+                except Exception as e:
+                    if sample_tick:
+                        logger.warning("Could not read grid power for avg: %s", e)
+                    else:
+                        logger.debug("Could not read grid power (instant): %s", e)
+
+            wb_now_kw = None
+            if wb_future is not None:
+                try:
+                    wb_now_kw = wb_future.result()
+                except Exception as e:
+                    logger.warning("Could not read WB power via Modbus: %s", e)
+
+            pv_now_kw = None
+            if pv_future is not None:
+                try:
+                    pv_now_kw = pv_future.result()
+                except Exception as e:
+                    logger.debug("Could not read PV power: %s", e)
+
             if PV_SURPLUS_MODE:
                 # Sample grid power every 10 seconds for averaging
-                if counter % 10 == 0:
-                    try:
-                        grid_kw = read_grid_power_kw()
-                        grid_list.append(grid_kw)
-                    except Exception as e:
-                        print(f"Warning: could not read grid power for avg: {e}")
+                if sample_tick and grid_now_kw is not None:
+                    if len(grid_list) == grid_list.maxlen:
+                        grid_sum -= grid_list[0]  # ältestes Sample fliegt raus
+                    grid_sum += grid_now_kw
+                    grid_list.append(grid_now_kw)
 
                 # Every 5 minutes or at startup: compute new settings
-                if grid_list and (counter == 299 or is_startup):
+                if grid_list and decision_tick:
                     # Read current charger state (phase, ampere, car state)
                     status_phase = charger.get_phase_mode()
                     phase = 1 if status_phase["phase_mode"] == "one" else 3
@@ -226,14 +472,10 @@ def main():
                     car_state = status_min["car_state"]
 
                     # Average grid power over last 5 minutes
-                    grid_avg_kw = sum(grid_list) / len(grid_list)
+                    grid_avg_kw = grid_sum / len(grid_list)
 
-                    # Read actual wallbox power via Modbus
-                    wb_power_kw = 0.0
-                    try:
-                        wb_power_kw = read_wb_power_kw(CHARGER_IP)
-                    except Exception as e:
-                        print(f"Warning: could not read WB power via Modbus: {e}")
+                    # Wallbox power: shared sample from this tick
+                    wb_power_kw = wb_now_kw if wb_now_kw is not None else 0.0
 
                     # Available PV power for the system: P_PV_available ≈ P_WB - P_grid
                     available_kw = wb_power_kw - grid_avg_kw
@@ -241,10 +483,10 @@ def main():
                     # Apply safety offset and clamp at zero
                     effective_kw = max(0.0, available_kw - params["deltaP"])
 
-                    print(
-                        f"[5min] Grid_avg: {grid_avg_kw:6.2f} kW | "
-                        f"WB_avg: {wb_power_kw:6.2f} kW | "
-                        f"Available_eff: {effective_kw:6.2f} kW"
+                    logger.info(
+                        "[5min] Grid_avg: %6.2f kW | WB_avg: %6.2f kW | "
+                        "Available_eff: %6.2f kW",
+                        grid_avg_kw, wb_power_kw, effective_kw,
                     )
 
                     phase_new, current_new = update_phase_and_current(effective_kw)
@@ -280,57 +522,54 @@ def main():
 
                     # Update state
                     is_startup = False
-                    grid_list = []
-
-                # Keep only last 30 samples (~5 minutes at 10 s step)
-                if len(grid_list) > 30:
-                    grid_list = grid_list[-30:]
+                    grid_list.clear()
+                    grid_sum = 0.0
 
             else:
                 # PV_SURPLUS_MODE is False -> do not touch charger, reset state
                 is_startup = True
-                grid_list = []
-
-            # ---- Debug output every loop: PV_now, Grid_now, WB_now ----
-            try:
-                # PV-Leistung direkt vom Wechselrichter (kW)
-                try:
-                    pv_now_kw = read_pv_power_kw()
-                except Exception as e:
-                    pv_now_kw = float("nan")
-                    print(f"Debug: could not read PV power: {e}")
-
-                # Momentane Grid-Leistung (kW) vom Zähler
-                try:
-                    grid_now_kw = read_grid_power_kw()
-                except Exception as e:
-                    grid_now_kw = float("nan")
-                    print(f"Debug: could not read grid power (instant): {e}")
+                grid_list.clear()
+                grid_sum = 0.0
 
-                # Momentane Wallbox-Leistung (kW) via Modbus
-                try:
-                    wb_now_kw = read_wb_power_kw(CHARGER_IP)
-                except Exception as e:
-                    wb_now_kw = float("nan")
-                    print(f"Debug: could not read WB power (instant): {e}")
+            # ---- Debug output: PV_now, Grid_now, WB_now (alle DEBUG_EVERY s) ----
+            # Nutzt die oben geteilten Samples; fehlgeschlagene Reads
+            # erscheinen als NaN.
+            if debug_tick:
+                pv_dbg = pv_now_kw if pv_now_kw is not None else float("nan")
+                grid_dbg = grid_now_kw if grid_now_kw is not None else float("nan")
+                wb_dbg = wb_now_kw if wb_now_kw is not None else float("nan")
 
                 # Available PV power for the system: P_PV_available ≈ P_WB - P_grid
-                available_kw = wb_now_kw - grid_now_kw
-
-                print(
-                    f"PV_now: {pv_now_kw:6.2f} kW | "
-                    f"Grid_now: {grid_now_kw:6.2f} kW | "
-                    f"WB_now: {wb_now_kw:6.2f} kW | "
-                    f"available_now: {available_kw:6.2f} kW"
-                )
-            except Exception as e:
-                print(f"Debug error: {e}")
+                available_kw = wb_dbg - grid_dbg
+
+                # Nur drucken, wenn sich wirklich etwas bewegt hat —
+                # sonst füllt der Leerlauf das Log mit identischen Zeilen.
+                debug_values = (pv_dbg, grid_dbg, wb_dbg)
+                if last_debug is None or any(
+                    _debug_changed(new, old)
+                    for new, old in zip(debug_values, last_debug)
+                ):
+                    logger.debug(
+                        "PV_now: %6.2f kW | Grid_now: %6.2f kW | "
+                        "WB_now: %6.2f kW | available_now: %6.2f kW",
+                        pv_dbg, grid_dbg, wb_dbg, available_kw,
+                    )
+                    last_debug = debug_values
 
         except Exception as e:
-            print(f"Error in main loop: {e}")
+            logger.error("Error in main loop: %s", e)
 
         counter = (counter + 1) % 300
-        time.sleep(1)
+
+        next_tick += 1.0
+        now = time.monotonic()
+        if now < next_tick:
+            time.sleep(next_tick - now)
+        else:
+            # I/O hat länger als den Tick gedauert: verpasste Deadlines
+            # überspringen statt Schlaf-Schulden anzusammeln.
+            while next_tick <= now:
+                next_tick += 1.0
 
 
 if __name__ == "__main__":